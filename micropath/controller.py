@@ -12,11 +12,11 @@
 # implied. See the License for the specific language governing
 # permissions and limitations under the License.
 
+import re
 import sys
 import traceback
 from wsgiref import simple_server
 
-import six
 import webob.dec
 import webob.exc
 
@@ -25,6 +25,61 @@ from micropath import injector
 from micropath import request
 
 
+# Matches the next non-empty segment of a URL path, skipping the
+# leading "/" characters; empty segments are ignored, as with
+# webob.Request.path_info_pop()
+_path_segment = re.compile(r'/*([^/]+)')
+
+
+def _request_accessor(attr):
+    """
+    Construct a deferred accessor for a request attribute.  The
+    accessor is invoked by the dependency injector, and converts any
+    exception raised while accessing the attribute into the exception
+    returned by the root controller's ``micropath_request_error()``
+    hook method.
+
+    :param str attr: The name of the request attribute.
+
+    :returns: A function suitable for use as a deferred callable by
+              ``micropath.injector.Injector``.
+    """
+
+    # Can't use operator.attrgetter because we need the parameter to
+    # be named "request"
+    def get(request, root_controller):
+        try:
+            return getattr(request, attr)
+        except Exception:
+            raise root_controller.micropath_request_error(
+                request, attr, sys.exc_info(),
+            )
+
+    return get
+
+
+def _request_deferred(attrs):
+    """
+    Construct the deferred accessors for a dictionary of request
+    attributes.
+
+    :param dict attrs: A dictionary mapping parameter names to the
+                       names of request attributes, as for the
+                       ``micropath_request_attrs`` attribute of
+                       ``micropath.Controller``.
+
+    :returns: A dictionary mapping the parameter names to deferred
+              accessors, suitable for passing to
+              ``micropath.injector.Injector.set_deferred_template()``.
+    :rtype: ``dict``
+    """
+
+    return {
+        key: _request_accessor(mapped or key)
+        for key, mapped in attrs.items()
+    }
+
+
 class ControllerMeta(type):
     """
     Metaclass for controllers.  This metaclass takes care of the task
@@ -51,25 +106,33 @@ class ControllerMeta(type):
         # Collect delegations
         delegations = {}
 
+        # Bind the names used in the loop below to locals; the loop
+        # visits everything in the class body, not just the routing
+        # elements
+        Element = elements.Element
+        Delegation = elements.Delegation
+        add_elem = root.add_elem
+
         # Walk the namespace looking for elements and callables with
         # Method elements
         for ident, value in namespace.items():
             # Add elements to the root
-            if isinstance(value, elements.Element):
-                root.add_elem(value, ident)
+            if isinstance(value, Element):
+                add_elem(value, ident)
                 continue
 
             # Add HTTP methods to the root as well
-            if hasattr(value, '_micropath_methods'):
-                for meth in value._micropath_methods:
-                    root.add_elem(meth, ident)
+            meths = getattr(value, '_micropath_methods', None)
+            if meths is not None:
+                for meth in meths:
+                    add_elem(meth, ident)
 
             # Mount the delegation to the root
-            if isinstance(value, elements.Delegation):
+            if isinstance(value, Delegation):
                 if value.element is None:
                     root.mount(value)
                 else:
-                    root.add_elem(value.element, ident)
+                    add_elem(value.element, ident)
 
                 # Add it to the set of delegations
                 delegations[ident] = value
@@ -81,20 +144,36 @@ class ControllerMeta(type):
                 if getattr(value, '_micropath_elem', None) is None:
                     value._micropath_elem = root
 
-        # Add the root and handlers list to the namespace
+        # The tree is complete; compute the compressed paths and the
+        # static path index
+        root.compress()
+        root.index_statics()
+        root.index_methods()
+
+        # Add the root and delegations to the namespace; the
+        # delegations are never modified after this, so use a tuple
         namespace.update(
             _micropath_root=root,
-            _micropath_delegations=[
+            _micropath_delegations=tuple(
                 delegation for _name, delegation in
                 sorted(delegations.items(), key=lambda x: x[0])
-            ],
+            ),
+        )
+
+        result = super(ControllerMeta, cls).__new__(
+            cls, name, bases, namespace,
+        )
+
+        # Construct the deferred accessors for the request attributes
+        # once, rather than on every request
+        result._micropath_deferred = _request_deferred(
+            result.micropath_request_attrs,
         )
 
-        return super(ControllerMeta, cls).__new__(cls, name, bases, namespace)
+        return result
 
 
-@six.add_metaclass(ControllerMeta)
-class Controller(object):
+class Controller(object, metaclass=ControllerMeta):
     """
     Controller class.  This is the central type for routing URL paths
     and HTTP methods to actual handlers.  See the
@@ -134,7 +213,10 @@ class Controller(object):
         all request attributes to be injected; subclasses that
         override this attribute may wish to copy the value from
         ``micropath.Controller`` and then update it to list additional
-        attributes.
+        attributes.  The class attribute is read once, when the class
+        is created, so the dictionary must not be modified afterwards;
+        overriding it on an instance is supported, at the cost of
+        constructing the accessors on each request.
 
     In addition to the class attributes listed above, subclasses may
     also override several methods to control behavior.  The methods
@@ -323,9 +405,10 @@ class Controller(object):
         # Note: The contents of this method are mostly copied from the
         # __call__() method of webob.dec.wsgify
 
-        # First, construct the request and set the default response
+        # First, construct the request; the default response is only
+        # created if it's used
         req = self.micropath_request(environ)
-        req.response = req.ResponseClass()
+        req.environ.pop('micropath.response', None)
 
         # Next, walk the path tree and invoke the handler; we use the
         # injector cleanup context manager to explicitly break
@@ -340,20 +423,15 @@ class Controller(object):
                 injector['request'] = req
                 injector['root_controller'] = self
 
-                # Add deferred accessors for all the other fields
-                def defer(key):
-                    # Can't use operator.attrgetter because we need
-                    # the parameter to be named "request"
-                    def get(request):
-                        try:
-                            return getattr(request, key)
-                        except Exception:
-                            raise self.micropath_request_error(
-                                request, key, sys.exc_info(),
-                            )
-                    return get
-                for key, mapped in self.micropath_request_attrs.items():
-                    injector.set_deferred(key, defer(mapped or key))
+                # Add deferred accessors for all the other fields;
+                # an instance that overrides the request attributes
+                # needs its own accessors
+                attrs = self.micropath_request_attrs
+                if attrs is type(self).micropath_request_attrs:
+                    deferred = self._micropath_deferred
+                else:
+                    deferred = _request_deferred(attrs)
+                injector.set_deferred_template(deferred)
 
                 # Hook for setting up additional injection settings
                 self.micropath_prepare_injector(req, injector)
@@ -385,16 +463,17 @@ class Controller(object):
             resp = req.response
 
         # Convert text and bytes
-        if isinstance(resp, six.text_type):
+        if isinstance(resp, str):
             resp = resp.encode(req.charset)
         if isinstance(resp, bytes):
             body = resp
             resp = req.response
             resp.write(body)
 
-        # Merge the cookies
-        if resp is not req.response:
-            resp = req.response.merge_cookies(resp)
+        # Merge the cookies, if the default response was created
+        default = req.environ.get('micropath.response')
+        if default is not None and resp is not default:
+            resp = default.merge_cookies(resp)
 
         # Return the response
         return resp(environ, start_response)
@@ -469,40 +548,76 @@ class Controller(object):
                   404 will be generated.
         """
 
+        # Fully static paths can be looked up directly
+        path_info = req.path_info
+        static = self._micropath_root.statics.get(path_info)
+        if static is not None:
+            req.script_name += path_info
+            req.path_info = ''
+
+            return static, False
+
         # Must the handler have path_info?
         path_info_required = True
 
+        # Walk the path segments with a cursor into path_info; the
+        # request itself is only updated once the walk is complete
+        pos = 0
+
         # Start at the controller's root
         elem = self._micropath_root
-        path_elem = req.path_info_peek()
-        while path_elem:
+        while True:
+            match = _path_segment.match(path_info, pos)
+            if not match:
+                # Ran off the end of the path_info
+                path_info_required = False
+                break
+            path_elem = match.group(1)
+
+            # If it starts a chain of static paths, try to consume the
+            # whole chain at once
+            chain = elem.chains.get(path_elem)
+            if chain is not None:
+                label, target = chain
+                start = match.start(1)
+                end = start + len(label)
+                if (path_info.startswith(label, start) and
+                        path_info[end:end + 1] in ('', '/')):
+                    elem = target
+                    pos = end
+                    continue
+
             # If it's a static path, we'll go down that branch
-            if path_elem in elem.paths:
-                elem = elem.paths[path_elem]
+            child = elem.paths.get(path_elem)
+            if child is not None:
+                elem = child
             elif elem.bindings is not None:
+                binding = elem.bindings
                 try:
-                    value = elem.bindings.validate(self, inj, path_elem)
+                    value = binding.validate(self, inj, path_elem)
                 except elements.SkipBinding:
                     break
 
                 # Save it into the injector and the urlvars
-                if elem.bindings.ident not in inj:
+                if binding.ident not in inj.explicit_keys:
                     # Only add to the injector if there are no
-                    # conflicts
-                    inj[elem.bindings.ident] = value
-                req.urlvars[elem.bindings.ident] = value
+                    # conflicts; the deferred request attributes
+                    # don't count as conflicts
+                    inj[binding.ident] = value
+                req.urlvars[binding.ident] = value
 
                 # Set the next element
-                elem = elem.bindings
+                elem = binding
             else:
                 break
 
-            # OK, pop off the path element and set up for the next one
-            req.path_info_pop()
-            path_elem = req.path_info_peek()
-        else:
-            # Ran off the end of the path_info
-            path_info_required = False
+            # OK, consume the path element and set up for the next one
+            pos = match.end()
+
+        # Move the consumed portion of path_info onto script_name
+        if pos:
+            req.script_name += path_info[:pos]
+            req.path_info = path_info[pos:]
 
         return elem, path_info_required
 
@@ -523,11 +638,11 @@ class Controller(object):
                   ``micropath.elements.Delegation``.
         """
 
-        # Pick out the Method instance
-        meth = elem.methods.get(
-            'GET' if req.method == 'HEAD' else req.method,
-            elem.methods.get(None),
-        )
+        # Pick out the Method instance, falling back to the method
+        # routed for all other HTTP methods
+        meth = elem.methods.get('GET' if req.method == 'HEAD' else req.method)
+        if meth is None:
+            meth = elem.default_method
 
         return (
             meth.func if meth else None,
@@ -547,12 +662,12 @@ class Controller(object):
         :rtype: ``set`` of ``str``
         """
 
-        # First, get the set of methods we see in elem.methods
-        meths = set(m for m in elem.methods if m is not None)
+        # First, get the set of methods explicitly routed at elem
+        meths = set(elem.routed_methods)
 
-        # Next, add the micropath_methods if None is in
-        # elem.methods
-        if None in elem.methods:
+        # Next, add the micropath_methods if there's a method routed
+        # for all of them
+        if elem.default_method is not None:
             meths |= self.micropath_methods
 
         # Now, add the fixed options: HEAD (if GET is present)
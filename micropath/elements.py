@@ -12,14 +12,40 @@
 # implied. See the License for the specific language governing
 # permissions and limitations under the License.
 
-import abc
-
-import six
+import collections
+import sys
+import types
 
 from micropath import injector
 
 
-@six.add_metaclass(abc.ABCMeta)
+# A read-only empty mapping, shared by elements that can never have
+# subordinate elements
+_empty = types.MappingProxyType({})
+
+# The maximum depth of an element tree; routing trees are shallow, so
+# anything deeper than this indicates a loop in the parent links
+_max_elem_depth = 256
+
+
+def _canonicalize(methods):
+    """
+    Canonicalize a sequence of HTTP method strings.  Each method is
+    converted to uppercase and interned, so that dictionary lookups
+    against ``Method`` identifiers compare by identity, and
+    duplicates are dropped while preserving the original order.
+
+    :param methods: The method strings.
+
+    :returns: The canonicalized method strings.
+    :rtype: ``tuple``
+    """
+
+    return tuple(collections.OrderedDict.fromkeys(
+        sys.intern(meth.upper()) for meth in methods
+    ))
+
+
 class Element(object):
     """
     Represent an abstract path element.  This can either be a constant
@@ -27,6 +53,15 @@ class Element(object):
     HTTP method (``Method``).
     """
 
+    __slots__ = (
+        'ident', 'parent', 'paths', 'bindings', 'methods', 'delegation',
+        'chains', 'routed_methods', 'default_method',
+    )
+
+    # Set by elements that can never have subordinate elements; these
+    # share a read-only empty mapping rather than allocating their own
+    _leaf = False
+
     def __init__(self, ident, parent=None):
         """
         Initialize an ``Element`` instance.
@@ -45,22 +80,31 @@ class Element(object):
         self.ident = ident
         self.parent = parent
 
-        # Set up subordinate lists
-        self.paths = {}
+        # Set up subordinate lists, and the path-compressed edges
+        # computed by Root.compress()
+        if self._leaf:
+            self.paths = self.methods = self.chains = _empty
+        else:
+            self.paths = {}
+            self.methods = {}
+            self.chains = {}
         self.bindings = None
-        self.methods = {}
 
         # For delegation to other controllers
         self.delegation = None
 
-    @abc.abstractmethod
+        # Explicitly routed HTTP methods and the method routed for
+        # all others; computed by Root.index_methods()
+        self.routed_methods = frozenset()
+        self.default_method = None
+
     def set_ident(self, ident):
         """
         Set the element identifier.  This can be used in the case that the
         identifier was not set at construction time.  Subclasses must
-        call the superclass abstract method to set the identifier,
-        then must update the subordinate lists in the parent object,
-        if a parent exists.
+        call the superclass method to set the identifier, then
+        must update the subordinate lists in the parent object, if a
+        parent exists.
 
         :param str ident: The identifier for the component.  For
                           constant components, this will be the
@@ -153,15 +197,14 @@ class Element(object):
 
         def decorator(func):
             # Construct the new Method objects
+            methods_map = self.methods
             if methods:
                 for meth_str in methods:
-                    if meth_str in self.methods:
-                        continue
                     meth = Method(meth_str, func, parent=self)
-                    self.methods[meth.ident] = meth
+                    methods_map[meth.ident] = meth
             else:
                 meth = Method(None, func, parent=self)
-                self.methods[meth.ident] = meth
+                methods_map[meth.ident] = meth
 
             # Mark the function as a handler and save its element
             func._micropath_handler = True
@@ -178,8 +221,12 @@ class Element(object):
             methods = ()
             return decorator(func)
 
+        # Canonicalize the methods once, so the duplicate check
+        # compares the same strings used as keys
+        methods = _canonicalize(methods)
+
         # Check for duplicate idents
-        dups = [meth_str for meth_str in methods if meth_str in self.methods]
+        dups = self.methods.keys() & methods
         if dups:
             raise ValueError(
                 'Method element(s) for "%s" already exist(s)' %
@@ -215,7 +262,7 @@ class Element(object):
         """
 
         # Make sure the delegation hasn't already been set
-        if self.delegation:
+        if self.delegation is not None:
             raise ValueError('delegation has already been set')
 
         # Wrap the delegation, if necessary
@@ -228,10 +275,13 @@ class Element(object):
 
         # Set the delegation
         if methods:
+            # Canonicalize the methods once, so the duplicate check
+            # compares the same strings used as keys
+            methods = _canonicalize(methods)
+
             # Check for duplicate idents
-            dups = [
-                meth_str for meth_str in methods if meth_str in self.methods
-            ]
+            methods_map = self.methods
+            dups = methods_map.keys() & methods
             if dups:
                 raise ValueError(
                     'Method element(s) for "%s" already exist(s)' %
@@ -240,10 +290,8 @@ class Element(object):
 
             # Method restrictions specified, so apply them
             for meth_str in methods:
-                if meth_str in self.methods:
-                    continue
                 meth = Method(meth_str, None, parent=self)
-                self.methods[meth.ident] = meth
+                methods_map[meth.ident] = meth
                 meth.delegation = delegation
         else:
             # Delegation on us
@@ -259,6 +307,8 @@ class Root(Element):
     has exactly one ``Root`` instance associated with it.
     """
 
+    __slots__ = ('statics',)
+
     def __init__(self):
         """
         Initialize a ``Root`` instance.
@@ -267,13 +317,17 @@ class Root(Element):
         # Initialize the superclass
         super(Root, self).__init__(None)
 
+        # Index of elements reachable through static paths only;
+        # computed by index_statics()
+        self.statics = {}
+
     def set_ident(self, ident):
         """
         Set the element identifier.  This can be used in the case that the
         identifier was not set at construction time.  Subclasses must
-        call the superclass abstract method to set the identifier,
-        then must update the subordinate lists in the parent object,
-        if a parent exists.
+        call the superclass method to set the identifier, then
+        must update the subordinate lists in the parent object, if a
+        parent exists.
 
         :param str ident: The identifier for the component.  For
                           constant components, this will be the
@@ -303,17 +357,13 @@ class Root(Element):
             ancestor is missing an identifier (and ``ident`` was not
             set or has been consumed by another element), or an
             element is of an unknown class.
+        :raises RuntimeError:
+            The element's ancestors are nested too deeply, which
+            indicates a loop in the parent links.
         """
 
-        # Handle the possibility of loops
-        seen = set()
-
-        # Walk up the tree
-        while True:
-            # Loop protection
-            assert id(elem) not in seen
-            seen.add(id(elem))
-
+        # Walk up the tree; the depth limit protects against loops
+        for _depth in range(_max_elem_depth):
             # Sanity-check the element
             if elem is self:
                 # Guess it's already been added to us
@@ -328,11 +378,13 @@ class Root(Element):
                     ident = None
 
             # Have we found the element to be added to the root?
-            if not elem.parent:
+            if elem.parent is None:
                 break
 
             # Walk up to the parent
             elem = elem.parent
+        else:
+            raise RuntimeError('element tree is too deep or contains a loop')
 
         # We've found the element to be added to the root, so do so
         if isinstance(elem, Path):
@@ -364,19 +416,124 @@ class Root(Element):
         # Set the element's parent
         elem.parent = self
 
+    def compress(self):
+        """
+        Compute the path-compressed edges of the element tree.  A chain
+        of ``Path`` elements, each of which has exactly one
+        subordinate ``Path`` and no bindings, methods, or delegation,
+        can be traversed in a single step.  For each element, the
+        ``chains`` dictionary maps the identifier of the first
+        ``Path`` in such a chain to a tuple of the "/"-joined
+        identifiers of the chain and the element at the end of the
+        chain.  This must be called once the element tree is
+        complete; it is called by the ``micropath.Controller``
+        metaclass.
+        """
+
+        # Walk the whole tree
+        queue = [self]
+        while queue:
+            elem = queue.pop()
+
+            chains = {}
+            for ident, child in elem.paths.items():
+                queue.append(child)
+
+                # An empty identifier or one containing "/" can
+                # never match a single path segment, so it can't be
+                # chained
+                if not ident or '/' in ident:
+                    continue
+
+                # Follow the chain of pass-through elements
+                labels = [ident]
+                target = child
+                while (len(target.paths) == 1 and
+                       target.bindings is None and
+                       not target.methods and
+                       target.delegation is None):
+                    label, = target.paths
+                    if not label or '/' in label:
+                        break
+
+                    labels.append(label)
+                    target = target.paths[label]
+
+                # Only chains of at least two elements are interesting
+                if len(labels) > 1:
+                    chains[ident] = ('/'.join(labels), target)
+
+            if elem.bindings is not None:
+                queue.append(elem.bindings)
+
+            elem.chains = chains
+
+    def index_statics(self):
+        """
+        Compute the index of elements that can be reached from the root
+        through ``Path`` elements alone.  The ``statics`` dictionary
+        maps the full URL path of each such element (e.g.,
+        "/api/v1/status") to the element.  This must be called once
+        the element tree is complete; it is called by the
+        ``micropath.Controller`` metaclass.
+        """
+
+        statics = {}
+
+        # Walk the static portion of the tree
+        queue = [('', self)]
+        while queue:
+            prefix, elem = queue.pop()
+            for ident, child in elem.paths.items():
+                # Can't be matched by the per-segment walk either
+                if not ident or '/' in ident:
+                    continue
+
+                path = '%s/%s' % (prefix, ident)
+                statics[path] = child
+                queue.append((path, child))
+
+        self.statics = statics
+
+    def index_methods(self):
+        """
+        Compute the set of HTTP methods explicitly routed at each
+        element of the tree.  The ``routed_methods`` frozenset of
+        each element contains the keys of its ``methods`` dictionary
+        other than ``None``, and ``default_method`` is the ``Method``
+        stored under ``None``, if any.  This must be called once the
+        element tree is complete; it is called by the
+        ``micropath.Controller`` metaclass.
+        """
+
+        # Walk the whole tree
+        queue = [self]
+        while queue:
+            elem = queue.pop()
+            queue.extend(elem.paths.values())
+            if elem.bindings is not None:
+                queue.append(elem.bindings)
+
+            elem.routed_methods = frozenset(
+                m for m in elem.methods if m is not None
+            )
+            elem.default_method = elem.methods.get(None)
+
 
 class Path(Element):
     """
     Represent a constant path element.
     """
 
+    __slots__ = ()
+
     def set_ident(self, ident):
         """
         Set the element identifier.  This can be used in the case that the
         identifier was not set at construction time.  Subclasses must
-        call the superclass abstract method to set the identifier,
-        then must update the subordinate lists in the parent object,
-        if a parent exists.
+        call the superclass method to set the identifier, then
+        must update the subordinate lists in the parent object, if a
+        parent exists.
 
         :param str ident: The identifier for the component.  For
                           constant components, this will be the
@@ -390,7 +547,7 @@ class Path(Element):
 
         super(Path, self).set_ident(ident)
 
-        if self.parent:
+        if self.parent is not None:
             if self.ident in self.parent.paths:
                 raise ValueError(
                     'Path element for "%s" already exists' % self.ident,
@@ -416,6 +573,8 @@ class Binding(Element):
     (use the ``@Binding.validator`` decorator to set).
     """
 
+    __slots__ = ('_validator', '_formatter')
+
     def __init__(self, ident, parent=None):
         """
         Initialize a ``Binding`` instance.
@@ -439,9 +598,9 @@ class Binding(Element):
         """
         Set the element identifier.  This can be used in the case that the
         identifier was not set at construction time.  Subclasses must
-        call the superclass abstract method to set the identifier,
-        then must update the subordinate lists in the parent object,
-        if a parent exists.
+        call the superclass method to set the identifier, then
+        must update the subordinate lists in the parent object, if a
+        parent exists.
 
         :param str ident: The identifier for the component.  For
                           constant components, this will be the
@@ -455,7 +614,7 @@ class Binding(Element):
 
         super(Binding, self).set_ident(ident)
 
-        if self.parent:
+        if self.parent is not None:
             if self.parent.bindings is not None:
                 raise ValueError(
                     'Binding element for "%s" already exists' % self.ident,
@@ -529,7 +688,7 @@ class Binding(Element):
         A function decorator that sets the formatter function for the
         binding.  If this decorator is not used, binding values will
         be converted to URL elements using a simple string conversion
-        (``six.text_type`` called on the value).
+        (``str`` called on the value).
 
         Besides ``self``, the formatter function is only passed the
         value; unlike with the ``@validator`` function, dependency
@@ -557,7 +716,7 @@ class Binding(Element):
         Format a value.  This converts the value of a binding parameter
         back into a textual URL path component.  If a ``@formatter``
         function has not been set, the value is converted using simple
-        string conversion (``six.text_type`` called on the value).
+        string conversion (``str`` called on the value).
 
         :param obj: The instance of the controller class.  This must
                     be passed so that ``self`` can be present in the
@@ -572,7 +731,11 @@ class Binding(Element):
         if self._formatter:
             return self._formatter(obj, value)
 
-        return six.text_type(value)
+        # Values parsed from the URL are usually already strings
+        if type(value) is str:
+            return value
+
+        return str(value)
 
 
 class Method(Element):
@@ -580,6 +743,11 @@ class Method(Element):
     Represent a method route.
     """
 
+    __slots__ = ('func',)
+
+    # Methods can't have subordinate elements
+    _leaf = True
+
     def __init__(self, ident, func, parent=None):
         """
         Initialize a ``Method`` instance.
@@ -594,9 +762,10 @@ class Method(Element):
         :type parent: ``Element``
         """
 
-        # Canonicalize the ident
-        if isinstance(ident, six.string_types):
-            ident = ident.upper()
+        # Canonicalize the ident; HTTP methods are a small set, so
+        # intern them to make the dictionary lookups cheaper
+        if isinstance(ident, str):
+            ident = sys.intern(ident.upper())
 
         # Initialize the superclass
         super(Method, self).__init__(ident, parent)
@@ -608,9 +777,9 @@ class Method(Element):
         """
         Set the element identifier.  This can be used in the case that the
         identifier was not set at construction time.  Subclasses must
-        call the superclass abstract method to set the identifier,
-        then must update the subordinate lists in the parent object,
-        if a parent exists.
+        call the superclass method to set the identifier, then
+        must update the subordinate lists in the parent object, if a
+        parent exists.
 
         :param str ident: The identifier for the component.  For
                           constant components, this will be the
@@ -708,6 +877,8 @@ class Delegation(object):
     of the controller class passed to the constructor.
     """
 
+    __slots__ = ('controller', 'kwargs', 'element', '_micropath_methods')
+
     def __init__(self, controller, kwargs):
         """
         Initialize the ``Delegation`` instance.
@@ -725,9 +896,6 @@ class Delegation(object):
         # The element may need to be added to the controller's root
         self.element = None
 
-        # Cache of values
-        self._cache = {}
-
     def __get__(self, obj, cls):
         """
         Implement the retriever portion of the descriptor protocol.
@@ -746,7 +914,11 @@ class Delegation(object):
         if obj is None:
             return self
 
-        return self.get(obj)
+        # Return the cached instance directly if there is one
+        try:
+            return obj.__dict__['_micropath_delegates'][self]
+        except KeyError:
+            return self.get(obj)
 
     def __set__(self, obj, value):
         """
@@ -758,7 +930,7 @@ class Delegation(object):
         :param value: The value to assign to the instance attribute.
         """
 
-        self._cache[id(obj)] = value
+        obj.__dict__.setdefault('_micropath_delegates', {})[self] = value
 
     def __delete__(self, obj):
         """
@@ -770,7 +942,7 @@ class Delegation(object):
         """
 
         # Try hard
-        self._cache.pop(id(obj), None)
+        obj.__dict__.get('_micropath_delegates', {}).pop(self, None)
 
     def get(self, obj):
         """
@@ -785,17 +957,19 @@ class Delegation(object):
                   class passed to the constructor.
         """
 
-        key = id(obj)
+        # Constructed instances are cached on the instance itself, so
+        # that they're released along with it
+        cache = obj.__dict__.setdefault('_micropath_delegates', {})
 
         # Construct a new one if needed
-        if key not in self._cache:
-            self._cache[key] = self.construct(obj)
+        if self not in cache:
+            cache[self] = self.construct(obj)
 
             # Set the parent and element
-            self._cache[key]._micropath_parent = obj
-            self._cache[key]._micropath_elem = self.element
+            cache[self]._micropath_parent = obj
+            cache[self]._micropath_elem = self.element
 
-        return self._cache[key]
+        return cache[self]
 
     def construct(self, obj):
         """
@@ -868,42 +1042,50 @@ def route(*methods):
               decorator for a method.
     """
 
+    # Check if methods consists of a single callable element; if so,
+    # decorate it directly rather than building a closure
+    if len(methods) == 1 and callable(methods[0]):
+        return _route(methods[0], ())
+
     def decorator(func):
-        meth_list = []
+        return _route(func, methods)
 
-        # Construct the new Method objects
-        seen = set()
-        if methods:
-            for meth_str in methods:
-                if meth_str in seen:
-                    continue
-                seen.add(meth_str)
+    return decorator
 
-                meth = Method(meth_str, func)
-                meth_list.append(meth)
-        else:
-            meth = Method(None, func)
-            meth_list.append(meth)
 
-        # Attach the method list to the function; this will be picked
-        # up by the metaclass
-        func._micropath_methods = meth_list
+def _route(func, methods):
+    """
+    Helper for the ``route()`` decorator.  Attaches a list of
+    ``Method`` objects to the function and marks it as a handler.
 
-        # Mark the function as a handler
-        func._micropath_handler = True
+    :param func: The function to decorate.
+    :param tuple methods: The method strings.  If empty, all
+                          otherwise undefined methods will be routed
+                          to the function.
 
-        # Pre-compute its want signature
-        injector.WantSignature.from_func(func)
+    :returns: The decorated function.
+    """
 
-        return func
+    # Construct the new Method objects; canonicalizing skips
+    # duplicates while preserving the declared order
+    if methods:
+        meth_list = [
+            Method(meth_str, func) for meth_str in _canonicalize(methods)
+        ]
+    else:
+        meth_list = [Method(None, func)]
 
-    # Check if methods consists of a single callable element
-    if len(methods) == 1 and callable(methods[0]):
-        func = methods[0]
-        methods = ()
-        return decorator(func)
+    # Attach the method list to the function; this will be picked up
+    # by the metaclass
+    func._micropath_methods = meth_list
 
-    return decorator
+    # Mark the function as a handler
+    func._micropath_handler = True
+
+    # Pre-compute its want signature
+    injector.WantSignature.from_func(func)
+
+    return func
 
 
 def mount(delegation, *methods, **kwargs):
@@ -935,18 +1117,14 @@ def mount(delegation, *methods, **kwargs):
 
     # If methods were specified, create them
     if methods:
-        delegation._micropath_methods = []
-
-        seen = set()
-        for meth_str in methods:
-            if meth_str in seen:
-                continue
-            seen.add(meth_str)
+        meth_list = [
+            Method(meth_str, None) for meth_str in _canonicalize(methods)
+        ]
 
-            meth = Method(meth_str, None)
-            delegation._micropath_methods.append(meth)
-
-            # Add the delegation to the Method
+        # Add the delegation to the Methods
+        for meth in meth_list:
             meth.delegation = delegation
 
+        delegation._micropath_methods = meth_list
+
     return delegation
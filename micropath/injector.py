@@ -12,12 +12,10 @@
 # implied. See the License for the specific language governing
 # permissions and limitations under the License.
 
-import collections
+import collections.abc
 import functools
 import inspect
 
-import six
-
 
 class WantSignature(object):
     """
@@ -27,105 +25,63 @@ class WantSignature(object):
     the core of the dependency injection implementation.
     """
 
-    if six.PY2:
-        @staticmethod
-        def _getsig(func):
-            """
-            Obtain a function signature, for Python 2.  This analyzes the
-            function argument specification and constructs the
-            argument order, required set of arguments, and optional
-            set of arguments.
-
-            :param func: The function to analyze.
-
-            :returns: A tuple of five elements.  The first element is
-                      a list providing the order of positional
-                      arguments.  The second element is a set of the
-                      arguments that the function requires be
-                      provided.  The third element is a set of the
-                      arguments that the function wants, if they are
-                      available.  The last two elements are booleans
-                      indicating whether the function wants all
-                      positional or keyword arguments, respectively.
-            """
-
-            # Get the argument specification
-            argspec = inspect.getargspec(func)
-            order = argspec.args[:]
-
-            # Figure out how many are optional
-            if argspec.defaults:
-                defcnt = -len(argspec.defaults)
-                required = set(order[:defcnt])
-                optional = set(order[defcnt:])
-            else:
-                required = set(order)
-                optional = set()
-
-            return (
-                order, required, optional,
-                argspec.varargs is not None,
-                argspec.keywords is not None,
-            )
-    else:
-        @staticmethod
-        def _getsig(func):
-            """
-            Obtain a function signature, for Python 3.  This analyzes the
-            function argument specification and constructs the
-            argument order, required set of arguments, and optional
-            set of arguments.
-
-            :param func: The function to analyze.
-
-            :returns: A tuple of five elements.  The first element is
-                      a list providing the order of positional
-                      arguments.  The second element is a set of the
-                      arguments that the function requires be
-                      provided.  The third element is a set of the
-                      arguments that the function wants, if they are
-                      available.  The last two elements are booleans
-                      indicating whether the function wants all
-                      positional or keyword arguments, respectively.
-            """
-
-            # Initialize the data to return
-            order = []
-            required = set()
-            optional = set()
-            all_pos = False
-            all_kw = False
-
-            # Get the function signature
-            sig = inspect.signature(func, follow_wrapped=False)
-
-            # Process the function signature
-            for param in sig.parameters.values():
-                # Pick only positional-capable arguments for order
-                if param.kind in (
-                        param.POSITIONAL_ONLY, param.POSITIONAL_OR_KEYWORD,
-                ):
-                    order.append(param.name)
-
-                # Pick only keyword-capable arguments for required and
-                # optional
-                if param.kind in (
-                        param.POSITIONAL_OR_KEYWORD, param.KEYWORD_ONLY,
-                ):
-                    # Presence of a default controls whether it's
-                    # required or optional
-                    if param.default is param.empty:
-                        required.add(param.name)
-                    else:
-                        optional.add(param.name)
-
-                # Toggle all_pos/all_kw as needed
-                if param.kind == param.VAR_POSITIONAL:
-                    all_pos = True
-                elif param.kind == param.VAR_KEYWORD:
-                    all_kw = True
-
-            return (order, required, optional, all_pos, all_kw)
+    @staticmethod
+    def _getsig(func):
+        """
+        Obtain a function signature.  This analyzes the function
+        argument specification and constructs the argument order,
+        required set of arguments, and optional set of arguments.
+
+        :param func: The function to analyze.
+
+        :returns: A tuple of five elements.  The first element is
+                  a list providing the order of positional
+                  arguments.  The second element is a set of the
+                  arguments that the function requires be
+                  provided.  The third element is a set of the
+                  arguments that the function wants, if they are
+                  available.  The last two elements are booleans
+                  indicating whether the function wants all
+                  positional or keyword arguments, respectively.
+        """
+
+        # Initialize the data to return
+        order = []
+        required = set()
+        optional = set()
+        all_pos = False
+        all_kw = False
+
+        # Get the function signature
+        sig = inspect.signature(func, follow_wrapped=False)
+
+        # Process the function signature
+        for param in sig.parameters.values():
+            # Pick only positional-capable arguments for order
+            if param.kind in (
+                    param.POSITIONAL_ONLY, param.POSITIONAL_OR_KEYWORD,
+            ):
+                order.append(param.name)
+
+            # Pick only keyword-capable arguments for required and
+            # optional
+            if param.kind in (
+                    param.POSITIONAL_OR_KEYWORD, param.KEYWORD_ONLY,
+            ):
+                # Presence of a default controls whether it's
+                # required or optional
+                if param.default is param.empty:
+                    required.add(param.name)
+                else:
+                    optional.add(param.name)
+
+            # Toggle all_pos/all_kw as needed
+            if param.kind == param.VAR_POSITIONAL:
+                all_pos = True
+            elif param.kind == param.VAR_KEYWORD:
+                all_kw = True
+
+        return (order, required, optional, all_pos, all_kw)
 
     @classmethod
     def from_func(cls, func, wrapped=None, provides=None,
@@ -158,42 +114,45 @@ class WantSignature(object):
         :rtype: ``WantSignature``
         """
 
-        # Construct and set the signature
-        if not hasattr(func, '_micropath_signature'):
-            # First, collect the function signature
-            order, func_req, func_opt, all_pos, all_kw = cls._getsig(func)
-
-            # If it's wrapping something, deal with that
-            if wrapped is not None:
-                wrapped_sig = cls.from_func(wrapped)
-
-                # First, merge in the required and optional
-                func_opt = (
-                    (func_opt - wrapped_sig.required) |
-                    (wrapped_sig.optional - func_req)
-                )
-                func_req |= wrapped_sig.required
-
-                # Next, discard provided arguments
-                provided = set(provides or [])
-                func_req -= provided
-                func_opt -= provided
-
-            # Handle required and optional
-            if all_kw:
-                if required is not None:
-                    func_req |= set(required)
-                    all_kw = False
-                if optional is not None:
-                    func_opt |= set(optional)
-                    all_kw = False
-
-            # Set the function signature
-            func._micropath_signature = cls(
-                func, order, func_req, func_opt, all_pos, all_kw,
+        # Use the cached signature, if there is one; this is on the
+        # request path via Injector.__call__()
+        sig = getattr(func, '_micropath_signature', None)
+        if sig is not None:
+            return sig
+
+        # First, collect the function signature
+        order, func_req, func_opt, all_pos, all_kw = cls._getsig(func)
+
+        # If it's wrapping something, deal with that
+        if wrapped is not None:
+            wrapped_sig = cls.from_func(wrapped)
+
+            # First, merge in the required and optional
+            func_opt = (
+                (func_opt - wrapped_sig.required) |
+                (wrapped_sig.optional - func_req)
             )
+            func_req |= wrapped_sig.required
+
+            # Next, discard provided arguments
+            provided = set(provides or [])
+            func_req -= provided
+            func_opt -= provided
+
+        # Handle required and optional
+        if all_kw:
+            if required is not None:
+                func_req |= set(required)
+                all_kw = False
+            if optional is not None:
+                func_opt |= set(optional)
+                all_kw = False
+
+        # Set the function signature
+        sig = cls(func, order, func_req, func_opt, all_pos, all_kw)
+        func._micropath_signature = sig
 
-        return func._micropath_signature
+        return sig
 
     def __init__(self, func, arg_order, required, optional, all_pos, all_kw):
         """
@@ -283,12 +242,17 @@ class WantSignature(object):
         if not additional:
             additional = {}
 
-        # Construct the set of desired keyword arguments
+        # Construct the set of desired keyword arguments; an
+        # all-keywords function only gets the explicit keys of an
+        # injector
         desired = self.all_args
         if self.all_kw:
-            desired |= set(additional) | set(kwargs)
+            explicit = getattr(kwargs, 'explicit_keys', None)
+            if explicit is None:
+                explicit = set(kwargs)
+            desired = desired | set(additional) | explicit
         satisfied = set(self.arg_order[:len(args)])
-        desired -= satisfied
+        desired = desired - satisfied
 
         # Construct the keyword arguments
         real_kw = {
@@ -325,11 +289,14 @@ class InjectorCleanup(object):
 
         self.injector = injector
         self.keep = None
+        self.template = None
+        self.masked = None
 
     def __enter__(self):
         """
         Enter the context manager.  This copies the set of existing keys
-        for later cleanup operations.
+        and the set of deleted template keys, and saves the deferred
+        template for later cleanup operations.
 
         :returns: The injector.
         :rtype: ``Injector``
@@ -340,14 +307,17 @@ class InjectorCleanup(object):
 
         # Copy the current set of keys
         self.keep = set(self.injector._keys)
+        self.template = self.injector._template
+        self.masked = set(self.injector._masked)
 
         return self.injector
 
     def __exit__(self, exc_type, exc_value, exc_tb):
         """
         Exit the context manager.  This deletes all keys added to the
-        injector since the context manager was entered.  The
-        exception, if any, is not handled.
+        injector since the context manager was entered, and restores
+        the deferred template and the set of deleted template keys.
+        The exception, if any, is not handled.
 
         :param exc_type: The type of the exception that was raised, or
                          ``None``.
@@ -362,17 +332,23 @@ class InjectorCleanup(object):
         # Must not be None
         assert self.keep is not None
 
-        # Delete the added keys
+        # Restore the template and delete the added keys
+        self.injector._template = self.template
         for key in self.injector._keys - self.keep:
             del self.injector[key]
 
+        # Deleting keys masks the template, so restore the mask last
+        self.injector._masked = self.masked
+
         # Reset keep
         self.keep = None
+        self.template = None
+        self.masked = None
 
         return None
 
 
-class Injector(collections.MutableMapping):
+class Injector(collections.abc.MutableMapping):
     """
     A mutable mapping that provides the collection of arguments that
     are available to be passed to a function.  This is used in
@@ -389,6 +365,8 @@ class Injector(collections.MutableMapping):
         self._available = {}  # values
         self._deferred = {}  # callables generating values
         self._keys = set()  # efficiency enhancement containing keys
+        self._template = {}  # shared callables for absent keys
+        self._masked = set()  # template keys that have been deleted
 
     def __len__(self):
         """
@@ -398,7 +376,12 @@ class Injector(collections.MutableMapping):
         :rtype: ``int``
         """
 
-        return len(self._keys)
+        keys = self._keys
+        masked = self._masked
+        return len(keys) + sum(
+            1 for key in self._template
+            if key not in keys and key not in masked
+        )
 
     def __iter__(self):
         """
@@ -407,22 +390,56 @@ class Injector(collections.MutableMapping):
         :returns: An iterator over the keys in the mapping.
         """
 
-        return iter(self._keys)
+        keys = self._keys
+        masked = self._masked
+
+        # Yield the explicitly set keys first, then the template keys
+        # they don't mask
+        for key in keys:
+            yield key
+        for key in self._template:
+            if key not in keys and key not in masked:
+                yield key
+
+    def __contains__(self, key):
+        """
+        Determine if a key is present in the mapping.  This does not
+        call any deferred callable.
+
+        :param key: The key to check for.
+
+        :returns: A ``True`` value if the key is present in the
+                  mapping, or ``False`` otherwise.
+        :rtype: ``bool``
+        """
+
+        if key in self._keys:
+            return True
+
+        return key in self._template and key not in self._masked
 
     def __getitem__(self, key):
         """
         Retrieve the value of an item.  If the value has not been set, but
         a deferred callable for it has, that deferred callable will be
-        called and the value set, prior to returning it.
+        called and the value set, prior to returning it.  The
+        deferred template is consulted only for keys that have
+        neither a value nor a deferred callable.
 
         :param key: The key of the item to retrieve.
 
         :returns: The value associated with that key.
         """
 
-        # Handle the KeyError case first
         if key not in self._keys:
-            raise KeyError(key)
+            # Handle the KeyError case first
+            if key not in self._template or key in self._masked:
+                raise KeyError(key)
+
+            # Generate the value from the template
+            value = self(self._template[key])
+            self[key] = value
+            return value
 
         # If it's not available, we'll need to call the deferred
         # action
@@ -446,13 +463,14 @@ class Injector(collections.MutableMapping):
     def __delitem__(self, key):
         """
         Delete the value of an item.  This also discards any deferred
-        callable that has been set for the key.
+        callable that has been set for the key, and masks the key in
+        the deferred template.
 
         :param key: The key of the item to delete.
         """
 
         # Handle the KeyError case first
-        if key not in self._keys:
+        if key not in self:
             raise KeyError(key)
 
         # Pop it off
@@ -460,6 +478,26 @@ class Injector(collections.MutableMapping):
         self._deferred.pop(key, None)
         self._keys.discard(key)
 
+        # Mask the template
+        if key in self._template:
+            self._masked.add(key)
+
+    @property
+    def explicit_keys(self):
+        """
+        Retrieve the keys that have been explicitly set, either with a
+        value or with a deferred callable.  Keys provided only by the
+        deferred template are not included; these keys are not
+        expanded for functions that accept all keyword arguments, and
+        URL bindings take precedence over them.  The returned set must
+        not be modified.
+
+        :returns: The explicitly set keys.
+        :rtype: ``set``
+        """
+
+        return self._keys
+
     def __call__(self, *args, **kwargs):
         """
         Call a function, injecting the keyword arguments desired by the
@@ -480,8 +518,8 @@ class Injector(collections.MutableMapping):
 
         # Unwrap class and instance methods
         if inspect.ismethod(func):
-            obj = six.get_method_self(func)
-            func = six.get_method_function(func)
+            obj = func.__self__
+            func = func.__func__
 
             # Update the args
             args = (obj,) + args
@@ -505,6 +543,40 @@ class Injector(collections.MutableMapping):
         """
 
         self._deferred[key] = func
+        self._keys.add(key)
+
+    def set_deferred_template(self, template):
+        """
+        Set a template of deferred callables.  This is similar to
+        calling ``set_deferred()`` for each item of the template, but
+        the template is shared rather than copied, so that setting up
+        a large number of rarely used keys is cheap.  Keys that have a
+        value or a deferred callable set mask the corresponding keys
+        of the template.  Keys provided only by the template are not
+        passed to functions that accept all keyword arguments, unless
+        the function explicitly names them.  If a template has already
+        been set, the new template is merged over it.
+
+        :param template: A mapping of keys to callables that will
+                         generate the values to associate with the
+                         keys.  This mapping must not be modified
+                         while the injector is in use.
+        """
+
+        if template is self._template:
+            return
+        elif self._template:
+            # There's already a template; merge the new one over it.
+            # The old template is not modified, since it is shared
+            merged = dict(self._template)
+            merged.update(template)
+            self._template = merged
+        else:
+            self._template = template
+
+        # The new template provides any keys that were deleted
+        if self._masked:
+            self._masked = self._masked.difference(template)
 
     def cleanup(self):
         """
@@ -556,8 +628,7 @@ def wraps(wrapped, assigned=functools.WRAPPER_ASSIGNMENTS,
           required=_unset, optional=_unset):
     """
     A function decorator for wrapping decorators.  This works just
-    like ``six.wraps()`` (which in turn works just like
-    ``functools.wraps()``), but additionally manages dependency
+    like ``functools.wraps()``, but additionally manages dependency
     injection metadata, allowing decorators to request data
     independent of the function they wrap.
 
@@ -608,7 +679,7 @@ def wraps(wrapped, assigned=functools.WRAPPER_ASSIGNMENTS,
         )
 
         # Next, wrap it
-        func = six.wraps(wrapped, assigned, updated)(func)
+        func = functools.wraps(wrapped, assigned, updated)(func)
 
         # The wrapper may override the signature, so reset it
         func._micropath_signature = sig
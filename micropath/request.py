@@ -14,7 +14,6 @@
 
 import inspect
 
-import six
 import webob
 
 from micropath import elements
@@ -26,12 +25,15 @@ class Request(webob.Request):
     A subclass of ``webob.Request`` containing additional support used
     by the ``micropath`` framework.  In particular, the ``injector``
     attribute contains the dependency injector used by ``micropath``
-    to invoke handler methods, and the ``base_path`` attribute is the
-    value of the ``SCRIPT_NAME`` WSGI environment variable at the time
-    the ``Request`` was constructed.  (This latter attribute may be
-    used to construct absolute paths to other ``micropath`` handlers.)
-    In addition, the ``url_for()`` method is capable of constructing a
-    URL for any given controller method.
+    to invoke handler methods; the ``response`` attribute contains a
+    default response, created on first access and stored in the
+    ``micropath.response`` key of the WSGI environment; and the
+    ``base_path`` attribute is the value of the ``SCRIPT_NAME`` WSGI
+    environment variable at the time the ``Request`` was constructed.
+    (This latter attribute may be used to construct absolute paths to
+    other ``micropath`` handlers.)  In addition, the ``url_for()``
+    method is capable of constructing a URL for any given controller
+    method.
     """
 
     def __init__(self, *args, **kwargs):
@@ -75,7 +77,7 @@ class Request(webob.Request):
             raise ValueError('unable to construct URL for %r' % args[0])
 
         # Get the controller and element
-        controller = six.get_method_self(args[0])
+        controller = args[0].__self__
         elem = args[0]._micropath_elem
 
         # Make sure it is a controller instance and not a class
@@ -126,6 +128,30 @@ class Request(webob.Request):
 
         return self.environ['micropath.injector']
 
+    @property
+    def response(self):
+        """
+        Retrieve the default response.  This is created on first access,
+        using the ``ResponseClass`` attribute, and stored in the WSGI
+        environment.
+        """
+
+        if 'micropath.response' not in self.environ:
+            self.environ['micropath.response'] = self.ResponseClass()
+
+        return self.environ['micropath.response']
+
+    @response.setter
+    def response(self, value):
+        """
+        Set the default response.
+
+        :param value: The new default response.
+        :type value: ``webob.Response``
+        """
+
+        self.environ['micropath.response'] = value
+
     @property
     def base_path(self):
         """
@@ -56,11 +56,12 @@ setuptools.setup(
         'Intended Audience :: Developers',
         'License :: OSI Approved :: Apache Software License',
         'Operating System :: OS Independent',
-        'Programming Language :: Python :: 2.7',
+        'Programming Language :: Python :: 3',
         'Programming Language :: Python :: 3.5',
         'Programming Language :: Python :: 3.6',
         'Topic :: Internet :: WWW/HTTP :: WSGI',
     ],
+    python_requires='>=3.5',
     packages=setuptools.find_packages(exclude=['tests', 'tests.*']),
     install_requires=readreq('requirements.txt'),
     tests_require=readreq('test-requirements.txt'),
@@ -0,0 +1,173 @@
+# Copyright (C) 2018 by Kevin L. Mitchell <klmitch@mit.edu>
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you
+# may not use this file except in compliance with the License. You may
+# obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied. See the License for the specific language governing
+# permissions and limitations under the License.
+
+import micropath
+
+from tests.function import utils
+
+
+class ItemController(micropath.Controller):
+    @micropath.route('post')
+    def create(self, json_body):
+        return 'item::create(name=%s)' % json_body['name']
+
+    item_id = micropath.bind()
+
+    @item_id.route('get')
+    def get(self, item_id, path_info):
+        return 'item::get(item_id=%s, path_info=%s)' % (
+            item_id, utils.safestr(path_info),
+        )
+
+
+class KwargsController(micropath.Controller):
+    @micropath.route('get')
+    def index(self, **kwargs):
+        return 'keys=%s' % ','.join(sorted(kwargs))
+
+    date = micropath.bind()
+
+    @date.route('get')
+    def day(self, date):
+        return 'date=%s' % date
+
+
+class OverrideController(micropath.Controller):
+    @micropath.route('get')
+    def index(self, foo=None):
+        return 'foo=%s' % utils.safestr(foo)
+
+
+class ValidatorController(micropath.Controller):
+    item_id = micropath.bind()
+
+    @item_id.validator
+    def item_id_validator(self, value, request):
+        return '%s@%s%s' % (value, request.script_name, request.path_info)
+
+    @item_id.route('get')
+    def get(self, item_id, request):
+        return 'item_id=%s, script_name=%s, path_info=%s' % (
+            item_id, request.script_name, request.path_info,
+        )
+
+
+class TestRequestAttrs(object):
+    def test_json_body(self):
+        controller = ItemController()
+
+        status, _headers, body = utils.invoke(
+            controller, '/',
+            method='POST',
+            content_type='application/json',
+            body=b'{"name": "spam"}',
+        )
+
+        assert status == '200 OK'
+        assert body == b'item::create(name=spam)'
+
+    def test_json_body_invalid(self):
+        controller = ItemController()
+
+        status, _headers, _body = utils.invoke(
+            controller, '/',
+            method='POST',
+            content_type='application/json',
+            body=b'{"name": ',
+        )
+
+        assert status == '400 Bad Request'
+
+    def test_path_info(self):
+        controller = ItemController()
+
+        status, _headers, body = utils.invoke(
+            controller, '/1234',
+            method='GET',
+        )
+
+        assert status == '200 OK'
+        assert body == b'item::get(item_id=1234, path_info=<None>)'
+
+    def test_path_info_remaining(self):
+        controller = ItemController()
+
+        status, _headers, body = utils.invoke(
+            controller, '/1234/extra/stuff',
+            method='GET',
+        )
+
+        assert status == '200 OK'
+        assert body == b'item::get(item_id=1234, path_info=/extra/stuff)'
+
+    def test_kwargs(self):
+        controller = KwargsController()
+
+        status, _headers, body = utils.invoke(
+            controller, '/',
+            method='GET',
+        )
+
+        assert status == '200 OK'
+        assert body == b'keys=request,root_controller'
+
+    def test_binding_named_like_attr(self):
+        controller = KwargsController()
+
+        status, _headers, body = utils.invoke(
+            controller, '/2024-01-01',
+            method='GET',
+        )
+
+        assert status == '200 OK'
+        assert body == b'date=2024-01-01'
+
+    def test_instance_override(self):
+        controller = OverrideController()
+        controller.micropath_request_attrs = dict(
+            micropath.Controller.micropath_request_attrs,
+            foo='path',
+        )
+
+        status, _headers, body = utils.invoke(
+            controller, '/',
+            method='GET',
+        )
+
+        assert status == '200 OK'
+        assert body == b'foo=/'
+
+    def test_no_override(self):
+        controller = OverrideController()
+
+        status, _headers, body = utils.invoke(
+            controller, '/',
+            method='GET',
+        )
+
+        assert status == '200 OK'
+        assert body == b'foo=<None>'
+
+    def test_validator_sees_unrouted_path(self):
+        controller = ValidatorController()
+
+        status, _headers, body = utils.invoke(
+            controller, '/1234/',
+            method='GET',
+        )
+
+        assert status == '200 OK'
+        assert body == (
+            b'item_id=1234@/1234/, script_name=/1234, path_info=/'
+        )
@@ -0,0 +1,64 @@
+# Copyright (C) 2018 by Kevin L. Mitchell <klmitch@mit.edu>
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you
+# may not use this file except in compliance with the License. You may
+# obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied. See the License for the specific language governing
+# permissions and limitations under the License.
+
+import webob
+
+import micropath
+
+from tests.function import utils
+
+
+class CookieController(micropath.Controller):
+    @micropath.route('get')
+    def index(self, request):
+        request.response.set_cookie('seen', 'yes')
+        return 'cookie::index()'
+
+    @micropath.route('post')
+    def create(self, request):
+        request.response.set_cookie('seen', 'yes')
+        return webob.Response(status=201, body=b'cookie::create()')
+
+    @micropath.route('put')
+    def update(self, request):
+        return webob.Response(status=202, body=b'cookie::update()')
+
+
+class TestResponse(object):
+    def test_default_response(self):
+        controller = CookieController()
+
+        status, headers, body = utils.invoke(controller, '/', method='GET')
+
+        assert status == '200 OK'
+        assert headers['set-cookie'].startswith('seen=yes')
+        assert body == b'cookie::index()'
+
+    def test_merged_cookies(self):
+        controller = CookieController()
+
+        status, headers, body = utils.invoke(controller, '/', method='POST')
+
+        assert status == '201 Created'
+        assert headers['set-cookie'].startswith('seen=yes')
+        assert body == b'cookie::create()'
+
+    def test_own_response(self):
+        controller = CookieController()
+
+        status, headers, body = utils.invoke(controller, '/', method='PUT')
+
+        assert status == '202 Accepted'
+        assert 'set-cookie' not in headers
+        assert body == b'cookie::update()'
@@ -0,0 +1,152 @@
+# Copyright (C) 2018 by Kevin L. Mitchell <klmitch@mit.edu>
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you
+# may not use this file except in compliance with the License. You may
+# obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied. See the License for the specific language governing
+# permissions and limitations under the License.
+
+import micropath
+
+from tests.function import utils
+
+
+class StatusController(micropath.Controller):
+    api = micropath.path()
+    v1 = api.path()
+    status = v1.path()
+
+    @status.route('get')
+    def get_status(self, request):
+        return 'status::get()'
+
+    health = status.path()
+    check = health.path()
+
+    @check.route('get')
+    def get_check(self, request):
+        return 'status::check()'
+
+
+class EmptyIdentController(micropath.Controller):
+    @micropath.route('get')
+    def index(self):
+        return 'root::index()'
+
+    x = micropath.path('')
+
+    @x.route('get')
+    def get_x(self):
+        return 'x::get()'
+
+
+class TestStatic(object):
+    def test_status_get(self):
+        controller = StatusController()
+
+        status, _headers, body = utils.invoke(
+            controller, '/api/v1/status',
+            method='GET',
+        )
+
+        assert status == '200 OK'
+        assert body == b'status::get()'
+
+    def test_status_get_trailing_slash(self):
+        controller = StatusController()
+
+        status, _headers, body = utils.invoke(
+            controller, '/api/v1/status/',
+            method='GET',
+        )
+
+        assert status == '200 OK'
+        assert body == b'status::get()'
+
+    def test_status_get_double_slash(self):
+        controller = StatusController()
+
+        status, _headers, body = utils.invoke(
+            controller, '/api//v1/status',
+            method='GET',
+        )
+
+        assert status == '200 OK'
+        assert body == b'status::get()'
+
+    def test_status_partial(self):
+        controller = StatusController()
+
+        status, _headers, _body = utils.invoke(
+            controller, '/api/v1',
+            method='GET',
+        )
+
+        assert status == '404 Not Found'
+
+    def test_status_prefix(self):
+        controller = StatusController()
+
+        status, _headers, _body = utils.invoke(
+            controller, '/api/v1/statuses',
+            method='GET',
+        )
+
+        assert status == '404 Not Found'
+
+    def test_status_url_for(self):
+        controller = StatusController()
+        req = micropath.Request.blank('/', base_url='http://example.com')
+
+        result = req.url_for(controller.get_status)
+
+        assert result == 'http://example.com/api/v1/status'
+
+    def test_check_get(self):
+        controller = StatusController()
+
+        status, _headers, body = utils.invoke(
+            controller, '/api/v1/status/health/check',
+            method='GET',
+        )
+
+        assert status == '200 OK'
+        assert body == b'status::check()'
+
+    def test_check_get_extra(self):
+        controller = StatusController()
+
+        status, _headers, _body = utils.invoke(
+            controller, '/api/v1/status/health/check/extra',
+            method='GET',
+        )
+
+        assert status == '404 Not Found'
+
+    def test_empty_ident_named(self):
+        controller = EmptyIdentController()
+
+        status, _headers, body = utils.invoke(
+            controller, '/x',
+            method='GET',
+        )
+
+        assert status == '200 OK'
+        assert body == b'x::get()'
+
+    def test_empty_ident_root(self):
+        controller = EmptyIdentController()
+
+        status, _headers, body = utils.invoke(
+            controller, '/',
+            method='GET',
+        )
+
+        assert status == '200 OK'
+        assert body == b'root::index()'
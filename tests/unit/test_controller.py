@@ -17,6 +17,7 @@ import webob.exc
 
 from micropath import controller
 from micropath import elements
+from micropath import injector
 
 
 class ExceptionForTest(Exception):
@@ -32,16 +33,27 @@ class TestControllerMeta(object):
         )
 
         assert result._micropath_root == mock_Root.return_value
-        assert result._micropath_delegations == []
+        assert result._micropath_delegations == ()
         mock_Root.assert_called_once_with()
+        mock_Root.return_value.compress.assert_called_once_with()
+        mock_Root.return_value.index_statics.assert_called_once_with()
+        mock_Root.return_value.index_methods.assert_called_once_with()
 
     def test_alt(self, mocker):
         mock_Root = mocker.patch.object(controller.elements, 'Root')
         namespace = {
             'elem1': mocker.Mock(spec=elements.Path),
             'elem2': mocker.Mock(spec=elements.Binding),
-            'deleg1': mocker.Mock(spec=elements.Delegation, element=None),
-            'deleg2': mocker.Mock(spec=elements.Delegation, element='elem'),
+            'deleg1': mocker.Mock(
+                spec=elements.Delegation,
+                element=None,
+                _micropath_methods=None,
+            ),
+            'deleg2': mocker.Mock(
+                spec=elements.Delegation,
+                element='elem',
+                _micropath_methods=None,
+            ),
             'func': mocker.Mock(
                 _micropath_methods=[
                     mocker.Mock(spec=elements.Method),
@@ -67,10 +79,10 @@ class TestControllerMeta(object):
         )
 
         assert result._micropath_root == mock_Root.return_value
-        assert result._micropath_delegations == [
+        assert result._micropath_delegations == (
             namespace['deleg1'],
             namespace['deleg2'],
-        ]
+        )
         assert result.func._micropath_elem is None
         assert result.handler1._micropath_elem == mock_Root.return_value
         assert result.handler2._micropath_elem == 'elem'
@@ -78,6 +90,9 @@ class TestControllerMeta(object):
         mock_Root.return_value.mount.assert_called_once_with(
             namespace['deleg1'],
         )
+        mock_Root.return_value.compress.assert_called_once_with()
+        mock_Root.return_value.index_statics.assert_called_once_with()
+        mock_Root.return_value.index_methods.assert_called_once_with()
         mock_Root.return_value.add_elem.assert_has_calls([
             mocker.call(namespace['deleg2'].element, 'deleg2'),
             mocker.call(namespace['elem1'], 'elem1'),
@@ -87,6 +102,54 @@ class TestControllerMeta(object):
         ], any_order=True)
         assert mock_Root.return_value.add_elem.call_count == 5
 
+    def test_deferred(self, mocker):
+        mocker.patch.object(controller.elements, 'Root')
+        mock_request_accessor = mocker.patch.object(
+            controller, '_request_accessor',
+            side_effect=lambda x: 'get_%s' % x,
+        )
+
+        result = controller.ControllerMeta(
+            'TestController', (controller.Controller,), {
+                'micropath_request_attrs': {'a': None, 'b': 'c'},
+            },
+        )
+
+        assert result._micropath_deferred == {
+            'a': 'get_a',
+            'b': 'get_c',
+        }
+        mock_request_accessor.assert_has_calls([
+            mocker.call('a'),
+            mocker.call('c'),
+        ], any_order=True)
+
+
+class TestRequestAccessor(object):
+    def test_base(self, mocker):
+        req = mocker.Mock(attr='value')
+        root_controller = mocker.Mock()
+
+        func = controller._request_accessor('attr')
+
+        assert func(req, root_controller) == 'value'
+        root_controller.micropath_request_error.assert_not_called()
+
+    def test_error(self, mocker):
+        mock_exc_info = mocker.patch.object(controller.sys, 'exc_info')
+        req = mocker.Mock(spec=[])
+        root_controller = mocker.Mock(**{
+            'micropath_request_error.return_value': ExceptionForTest(),
+        })
+
+        func = controller._request_accessor('attr')
+
+        with pytest.raises(ExceptionForTest):
+            func(req, root_controller)
+        root_controller.micropath_request_error.assert_called_once_with(
+            req, 'attr', mock_exc_info.return_value,
+        )
+
 
 class TestController(object):
     def test_init(self, mocker):
@@ -118,34 +181,34 @@ class TestController(object):
             obj, 'micropath_request_error',
             return_value=ExceptionForTest(),
         )
+        injector.set_deferred_template.assert_called_once_with(
+            obj._micropath_deferred,
+        )
         keys = set()
-        for pos, _kw in injector.set_deferred.call_args_list:
-            # Get the call arguments
-            key = pos[0]
-            func = pos[1]
+        for key, func in obj._micropath_deferred.items():
             real_key = (
                 controller.Controller.micropath_request_attrs[key] or key
             )
 
             # Check what happens when the function is called
-            assert func(req) == getattr(req, real_key)
+            assert func(req, obj) == getattr(req, real_key)
 
             # Check what happens if the attribute doesn't exist
             delattr(req, real_key)
             with pytest.raises(ExceptionForTest):
-                func(req)
+                func(req, obj)
             mock_micropath_request_error.assert_called_once_with(
                 req, real_key, mock_exc_info.return_value,
             )
             mock_micropath_request_error.reset_mock()
 
             # We've tested for this key
-            keys.add(pos[0])
+            keys.add(key)
 
         assert keys == set(controller.Controller.micropath_request_attrs)
 
     def test_call_base(self, mocker):
-        req = mocker.MagicMock(charset='utf-8', urlvars={'a': 1})
+        req = mocker.MagicMock(charset='utf-8', urlvars={'a': 1}, environ={})
         inj = req.injector.cleanup.return_value.__enter__.return_value
         mock_Request = mocker.patch.object(
             controller.Controller, 'micropath_request',
@@ -175,11 +238,8 @@ class TestController(object):
 
         result = obj('environ', 'start_response')
 
-        assert req.response == req.ResponseClass.return_value
-        resp = req.response.merge_cookies.return_value
-        assert result == resp.return_value
         mock_Request.assert_called_once_with('environ')
-        req.ResponseClass.assert_called_once_with()
+        req.ResponseClass.assert_not_called()
         req.injector.cleanup.assert_called_once_with()
         mock_micropath_prepare_injector.assert_called_once_with(req, inj)
         mock_micropath_dispatch.assert_called_once_with(req, inj)
@@ -187,12 +247,13 @@ class TestController(object):
         mock_micropath_server_error.assert_not_called()
         mock_HTTPInternalServerError.assert_not_called()
         req.response.write.assert_not_called()
-        req.response.merge_cookies.assert_called_once_with(base_resp)
-        resp.assert_called_once_with('environ', 'start_response')
+        req.response.merge_cookies.assert_not_called()
+        base_resp.assert_called_once_with('environ', 'start_response')
+        assert result == base_resp.return_value
         self.check_injector(obj, req, mocker, mock_exc_info, a=1)
 
     def test_call_return_none(self, mocker):
-        req = mocker.MagicMock(charset='utf-8', urlvars={'a': 1})
+        req = mocker.MagicMock(charset='utf-8', urlvars={'a': 1}, environ={})
         inj = req.injector.cleanup.return_value.__enter__.return_value
         mock_Request = mocker.patch.object(
             controller.Controller, 'micropath_request',
@@ -222,11 +283,10 @@ class TestController(object):
 
         result = obj('environ', 'start_response')
 
-        assert req.response == req.ResponseClass.return_value
         resp = req.response
         assert result == resp.return_value
         mock_Request.assert_called_once_with('environ')
-        req.ResponseClass.assert_called_once_with()
+        req.ResponseClass.assert_not_called()
         req.injector.cleanup.assert_called_once_with()
         mock_micropath_prepare_injector.assert_called_once_with(req, inj)
         mock_micropath_dispatch.assert_called_once_with(req, inj)
@@ -239,7 +299,7 @@ class TestController(object):
         self.check_injector(obj, req, mocker, mock_exc_info, a=1)
 
     def test_call_return_text(self, mocker):
-        req = mocker.MagicMock(charset='utf-8', urlvars={'a': 1})
+        req = mocker.MagicMock(charset='utf-8', urlvars={'a': 1}, environ={})
         inj = req.injector.cleanup.return_value.__enter__.return_value
         mock_Request = mocker.patch.object(
             controller.Controller, 'micropath_request',
@@ -269,11 +329,10 @@ class TestController(object):
 
         result = obj('environ', 'start_response')
 
-        assert req.response == req.ResponseClass.return_value
         resp = req.response
         assert result == resp.return_value
         mock_Request.assert_called_once_with('environ')
-        req.ResponseClass.assert_called_once_with()
+        req.ResponseClass.assert_not_called()
         req.injector.cleanup.assert_called_once_with()
         mock_micropath_prepare_injector.assert_called_once_with(req, inj)
         mock_micropath_dispatch.assert_called_once_with(req, inj)
@@ -288,7 +347,7 @@ class TestController(object):
         self.check_injector(obj, req, mocker, mock_exc_info, a=1)
 
     def test_call_return_bytes(self, mocker):
-        req = mocker.MagicMock(charset='utf-8', urlvars={'a': 1})
+        req = mocker.MagicMock(charset='utf-8', urlvars={'a': 1}, environ={})
         inj = req.injector.cleanup.return_value.__enter__.return_value
         mock_Request = mocker.patch.object(
             controller.Controller, 'micropath_request',
@@ -318,11 +377,10 @@ class TestController(object):
 
         result = obj('environ', 'start_response')
 
-        assert req.response == req.ResponseClass.return_value
         resp = req.response
         assert result == resp.return_value
         mock_Request.assert_called_once_with('environ')
-        req.ResponseClass.assert_called_once_with()
+        req.ResponseClass.assert_not_called()
         req.injector.cleanup.assert_called_once_with()
         mock_micropath_prepare_injector.assert_called_once_with(req, inj)
         mock_micropath_dispatch.assert_called_once_with(req, inj)
@@ -337,7 +395,7 @@ class TestController(object):
         self.check_injector(obj, req, mocker, mock_exc_info, a=1)
 
     def test_call_http_exception(self, mocker):
-        req = mocker.MagicMock(charset='utf-8', urlvars={'a': 1})
+        req = mocker.MagicMock(charset='utf-8', urlvars={'a': 1}, environ={})
         inj = req.injector.cleanup.return_value.__enter__.return_value
         mock_Request = mocker.patch.object(
             controller.Controller, 'micropath_request',
@@ -347,9 +405,13 @@ class TestController(object):
             controller.Controller, 'micropath_prepare_injector',
         )
         exc = webob.exc.HTTPException('test', 'wsgi_response')
+
+        def fake_dispatch(req_, inj_):
+            req.environ['micropath.response'] = req.response
+            raise exc
         mock_micropath_dispatch = mocker.patch.object(
             controller.Controller, '_micropath_dispatch',
-            side_effect=exc,
+            side_effect=fake_dispatch,
         )
         mock_exc_info = mocker.patch.object(
             controller.sys, 'exc_info',
@@ -368,11 +430,10 @@ class TestController(object):
 
         result = obj('environ', 'start_response')
 
-        assert req.response == req.ResponseClass.return_value
         resp = req.response.merge_cookies.return_value
         assert result == resp.return_value
         mock_Request.assert_called_once_with('environ')
-        req.ResponseClass.assert_called_once_with()
+        req.ResponseClass.assert_not_called()
         req.injector.cleanup.assert_called_once_with()
         mock_micropath_prepare_injector.assert_called_once_with(req, inj)
         mock_micropath_dispatch.assert_called_once_with(req, inj)
@@ -385,7 +446,7 @@ class TestController(object):
         self.check_injector(obj, req, mocker, mock_exc_info, a=1)
 
     def test_call_exceptionfortest(self, mocker):
-        req = mocker.MagicMock(charset='utf-8', urlvars={'a': 1})
+        req = mocker.MagicMock(charset='utf-8', urlvars={'a': 1}, environ={})
         inj = req.injector.cleanup.return_value.__enter__.return_value
         mock_Request = mocker.patch.object(
             controller.Controller, 'micropath_request',
@@ -415,11 +476,8 @@ class TestController(object):
 
         result = obj('environ', 'start_response')
 
-        assert req.response == req.ResponseClass.return_value
-        resp = req.response.merge_cookies.return_value
-        assert result == resp.return_value
         mock_Request.assert_called_once_with('environ')
-        req.ResponseClass.assert_called_once_with()
+        req.ResponseClass.assert_not_called()
         req.injector.cleanup.assert_called_once_with()
         mock_micropath_prepare_injector.assert_called_once_with(req, inj)
         mock_micropath_dispatch.assert_called_once_with(req, inj)
@@ -430,12 +488,13 @@ class TestController(object):
         base_resp = mock_micropath_server_error.return_value
         mock_HTTPInternalServerError.assert_not_called()
         req.response.write.assert_not_called()
-        req.response.merge_cookies.assert_called_once_with(base_resp)
-        resp.assert_called_once_with('environ', 'start_response')
+        req.response.merge_cookies.assert_not_called()
+        base_resp.assert_called_once_with('environ', 'start_response')
+        assert result == base_resp.return_value
         self.check_injector(obj, req, mocker, mock_exc_info, a=1)
 
     def test_call_last_resort_exception(self, mocker):
-        req = mocker.MagicMock(charset='utf-8', urlvars={'a': 1})
+        req = mocker.MagicMock(charset='utf-8', urlvars={'a': 1}, environ={})
         inj = req.injector.cleanup.return_value.__enter__.return_value
         mock_Request = mocker.patch.object(
             controller.Controller, 'micropath_request',
@@ -466,11 +525,8 @@ class TestController(object):
 
         result = obj('environ', 'start_response')
 
-        assert req.response == req.ResponseClass.return_value
-        resp = req.response.merge_cookies.return_value
-        assert result == resp.return_value
         mock_Request.assert_called_once_with('environ')
-        req.ResponseClass.assert_called_once_with()
+        req.ResponseClass.assert_not_called()
         req.injector.cleanup.assert_called_once_with()
         mock_micropath_prepare_injector.assert_called_once_with(req, inj)
         mock_micropath_dispatch.assert_called_once_with(req, inj)
@@ -481,12 +537,13 @@ class TestController(object):
         mock_HTTPInternalServerError.assert_called_once_with(None)
         base_resp = mock_HTTPInternalServerError.return_value
         req.response.write.assert_not_called()
-        req.response.merge_cookies.assert_called_once_with(base_resp)
-        resp.assert_called_once_with('environ', 'start_response')
+        req.response.merge_cookies.assert_not_called()
+        base_resp.assert_called_once_with('environ', 'start_response')
+        assert result == base_resp.return_value
         self.check_injector(obj, req, mocker, mock_exc_info, a=1)
 
     def test_call_last_resort_exception_debug(self, mocker):
-        req = mocker.MagicMock(charset='utf-8', urlvars={'a': 1})
+        req = mocker.MagicMock(charset='utf-8', urlvars={'a': 1}, environ={})
         inj = req.injector.cleanup.return_value.__enter__.return_value
         mock_Request = mocker.patch.object(
             controller.Controller, 'micropath_request',
@@ -519,11 +576,8 @@ class TestController(object):
 
         result = obj('environ', 'start_response')
 
-        assert req.response == req.ResponseClass.return_value
-        resp = req.response.merge_cookies.return_value
-        assert result == resp.return_value
         mock_Request.assert_called_once_with('environ')
-        req.ResponseClass.assert_called_once_with()
+        req.ResponseClass.assert_not_called()
         req.injector.cleanup.assert_called_once_with()
         mock_micropath_prepare_injector.assert_called_once_with(req, inj)
         mock_micropath_dispatch.assert_called_once_with(req, inj)
@@ -534,8 +588,9 @@ class TestController(object):
         mock_HTTPInternalServerError.assert_called_once_with('exception')
         base_resp = mock_HTTPInternalServerError.return_value
         req.response.write.assert_not_called()
-        req.response.merge_cookies.assert_called_once_with(base_resp)
-        resp.assert_called_once_with('environ', 'start_response')
+        req.response.merge_cookies.assert_not_called()
+        base_resp.assert_called_once_with('environ', 'start_response')
+        assert result == base_resp.return_value
         self.check_injector(obj, req, mocker, mock_exc_info, a=1)
 
     def test_micropath_dispatch_call_func(self, mocker):
@@ -925,22 +980,70 @@ class TestController(object):
             if elem.skip:
                 elem.validate.side_effect = elements.SkipBinding()
             elem.paths = {x: elems[x] for x in elem.t_paths}
+            elem.chains = {}
+            elem.bindings = (
+                None if elem.t_bindings is None else elems[elem.t_bindings]
+            )
+        elems[None].statics = {}
+        mocker.patch.object(
+            controller.Controller, '_micropath_root', elems[None],
+        )
+        req = mocker.Mock(**{
+            'path_info': '/a/1/c/2/',
+            'script_name': '/base',
+            'urlvars': {},
+        })
+        inj = injector.Injector()
+        obj = controller.Controller()
+
+        result = obj._micropath_resolve(req, inj)
+
+        assert result == (elems['d'], False)
+        assert req.script_name == '/base/a/1/c/2'
+        assert req.path_info == '/'
+        url_vars = {
+            'b': elems['b'].validate.return_value,
+            'd': elems['d'].validate.return_value,
+        }
+        assert inj == url_vars
+        assert req.urlvars == url_vars
+        elems['b'].validate.assert_called_once_with(obj, inj, '1')
+        elems['d'].validate.assert_called_once_with(obj, inj, '2')
+
+    def test_micropath_resolve_empty_segments(self, mocker):
+        elems = {
+            None: mocker.Mock(t_paths=['a'], t_bindings=None, skip=False),
+            'a': mocker.Mock(t_paths=[], t_bindings='b', skip=False),
+            'b': mocker.Mock(t_paths=['c'], t_bindings=None, skip=False),
+            'c': mocker.Mock(t_paths=[], t_bindings='d', skip=False),
+            'd': mocker.Mock(t_paths=[], t_bindings=None, skip=False),
+        }
+        for name, elem in elems.items():
+            elem.ident = name
+            if elem.skip:
+                elem.validate.side_effect = elements.SkipBinding()
+            elem.paths = {x: elems[x] for x in elem.t_paths}
+            elem.chains = {}
             elem.bindings = (
                 None if elem.t_bindings is None else elems[elem.t_bindings]
             )
+        elems[None].statics = {}
         mocker.patch.object(
             controller.Controller, '_micropath_root', elems[None],
         )
         req = mocker.Mock(**{
-            'path_info_peek.side_effect': ['a', '1', 'c', '2', ''],
+            'path_info': '//a//1/c/2',
+            'script_name': '/base',
             'urlvars': {},
         })
-        inj = {}
+        inj = injector.Injector()
         obj = controller.Controller()
 
         result = obj._micropath_resolve(req, inj)
 
         assert result == (elems['d'], False)
+        assert req.script_name == '/base//a//1/c/2'
+        assert req.path_info == ''
         url_vars = {
             'b': elems['b'].validate.return_value,
             'd': elems['d'].validate.return_value,
@@ -950,6 +1053,29 @@ class TestController(object):
         elems['b'].validate.assert_called_once_with(obj, inj, '1')
         elems['d'].validate.assert_called_once_with(obj, inj, '2')
 
+    def test_micropath_resolve_empty_ident(self, mocker):
+        root = elements.Root()
+        empty = elements.Path(None, root)
+        empty.ident = ''
+        root.paths[''] = empty
+        root.compress()
+        root.index_statics()
+        mocker.patch.object(controller.Controller, '_micropath_root', root)
+        obj = controller.Controller()
+
+        # Resolve through the static index and through the walk alone
+        results = []
+        for statics in (root.statics, {}):
+            root.statics = statics
+            req = mocker.Mock(**{
+                'path_info': '/',
+                'script_name': '/base',
+                'urlvars': {},
+            })
+            results.append(obj._micropath_resolve(req, injector.Injector()))
+
+        assert results[0] == results[1] == (root, False)
+
     def test_micropath_resolve_injector_conflict(self, mocker):
         elems = {
             None: mocker.Mock(t_paths=['a'], t_bindings=None, skip=False),
@@ -963,22 +1089,28 @@ class TestController(object):
             if elem.skip:
                 elem.validate.side_effect = elements.SkipBinding()
             elem.paths = {x: elems[x] for x in elem.t_paths}
+            elem.chains = {}
             elem.bindings = (
                 None if elem.t_bindings is None else elems[elem.t_bindings]
             )
+        elems[None].statics = {}
         mocker.patch.object(
             controller.Controller, '_micropath_root', elems[None],
         )
         req = mocker.Mock(**{
-            'path_info_peek.side_effect': ['a', '1', 'c', '2', ''],
+            'path_info': '/a/1/c/2/',
+            'script_name': '/base',
             'urlvars': {},
         })
-        inj = {'d': 'x'}
+        inj = injector.Injector()
+        inj['d'] = 'x'
         obj = controller.Controller()
 
         result = obj._micropath_resolve(req, inj)
 
         assert result == (elems['d'], False)
+        assert req.script_name == '/base/a/1/c/2'
+        assert req.path_info == '/'
         assert inj == {
             'b': elems['b'].validate.return_value,
             'd': 'x',
@@ -990,6 +1122,52 @@ class TestController(object):
         elems['b'].validate.assert_called_once_with(obj, inj, '1')
         elems['d'].validate.assert_called_once_with(obj, inj, '2')
 
+    def test_micropath_resolve_injector_template(self, mocker):
+        elems = {
+            None: mocker.Mock(t_paths=['a'], t_bindings=None, skip=False),
+            'a': mocker.Mock(t_paths=[], t_bindings='b', skip=False),
+            'b': mocker.Mock(t_paths=['c'], t_bindings=None, skip=False),
+            'c': mocker.Mock(t_paths=[], t_bindings='d', skip=False),
+            'd': mocker.Mock(t_paths=[], t_bindings=None, skip=False),
+        }
+        for name, elem in elems.items():
+            elem.ident = name
+            if elem.skip:
+                elem.validate.side_effect = elements.SkipBinding()
+            elem.paths = {x: elems[x] for x in elem.t_paths}
+            elem.chains = {}
+            elem.bindings = (
+                None if elem.t_bindings is None else elems[elem.t_bindings]
+            )
+        elems[None].statics = {}
+        mocker.patch.object(
+            controller.Controller, '_micropath_root', elems[None],
+        )
+        req = mocker.Mock(**{
+            'path_info': '/a/1/c/2/',
+            'script_name': '/base',
+            'urlvars': {},
+        })
+        inj = injector.Injector()
+        inj.set_deferred_template({'d': 'x'})
+        obj = controller.Controller()
+
+        result = obj._micropath_resolve(req, inj)
+
+        assert result == (elems['d'], False)
+        assert req.script_name == '/base/a/1/c/2'
+        assert req.path_info == '/'
+        assert inj == {
+            'b': elems['b'].validate.return_value,
+            'd': elems['d'].validate.return_value,
+        }
+        assert req.urlvars == {
+            'b': elems['b'].validate.return_value,
+            'd': elems['d'].validate.return_value,
+        }
+        elems['b'].validate.assert_called_once_with(obj, inj, '1')
+        elems['d'].validate.assert_called_once_with(obj, inj, '2')
+
     def test_micropath_resolve_skip_last(self, mocker):
         elems = {
             None: mocker.Mock(t_paths=['a'], t_bindings=None, skip=False),
@@ -1003,22 +1181,27 @@ class TestController(object):
             if elem.skip:
                 elem.validate.side_effect = elements.SkipBinding()
             elem.paths = {x: elems[x] for x in elem.t_paths}
+            elem.chains = {}
             elem.bindings = (
                 None if elem.t_bindings is None else elems[elem.t_bindings]
             )
+        elems[None].statics = {}
         mocker.patch.object(
             controller.Controller, '_micropath_root', elems[None],
         )
         req = mocker.Mock(**{
-            'path_info_peek.side_effect': ['a', '1', 'c', '2', ''],
+            'path_info': '/a/1/c/2/',
+            'script_name': '/base',
             'urlvars': {},
         })
-        inj = {}
+        inj = injector.Injector()
         obj = controller.Controller()
 
         result = obj._micropath_resolve(req, inj)
 
         assert result == (elems['c'], True)
+        assert req.script_name == '/base/a/1/c'
+        assert req.path_info == '/2/'
         url_vars = {
             'b': elems['b'].validate.return_value,
         }
@@ -1039,22 +1222,27 @@ class TestController(object):
             if elem.skip:
                 elem.validate.side_effect = elements.SkipBinding()
             elem.paths = {x: elems[x] for x in elem.t_paths}
+            elem.chains = {}
             elem.bindings = (
                 None if elem.t_bindings is None else elems[elem.t_bindings]
             )
+        elems[None].statics = {}
         mocker.patch.object(
             controller.Controller, '_micropath_root', elems[None],
         )
         req = mocker.Mock(**{
-            'path_info_peek.side_effect': ['a', '1', 'c', '2', ''],
+            'path_info': '/a/1/c/2/',
+            'script_name': '/base',
             'urlvars': {},
         })
-        inj = {}
+        inj = injector.Injector()
         obj = controller.Controller()
 
         result = obj._micropath_resolve(req, inj)
 
         assert result == (elems['c'], True)
+        assert req.script_name == '/base/a/1/c'
+        assert req.path_info == '/2/'
         url_vars = {
             'b': elems['b'].validate.return_value,
         }
@@ -1062,10 +1250,76 @@ class TestController(object):
         assert req.urlvars == url_vars
         elems['b'].validate.assert_called_once_with(obj, inj, '1')
 
+    def test_micropath_resolve_static(self, mocker):
+        target = mocker.Mock()
+        root = mocker.Mock(statics={'/a/b/c': target})
+        mocker.patch.object(controller.Controller, '_micropath_root', root)
+        req = mocker.Mock(**{
+            'path_info': '/a/b/c',
+            'script_name': '/base',
+            'urlvars': {},
+        })
+        inj = injector.Injector()
+        obj = controller.Controller()
+
+        result = obj._micropath_resolve(req, inj)
+
+        assert result == (target, False)
+        assert req.script_name == '/base/a/b/c'
+        assert req.path_info == ''
+        assert inj == {}
+        assert req.urlvars == {}
+
+    def test_micropath_resolve_chain(self, mocker):
+        target = mocker.Mock(paths={}, chains={}, bindings=None)
+        root = mocker.Mock(
+            paths={'a': mocker.Mock()},
+            chains={'a': ('a/b/c', target)},
+            bindings=None,
+            statics={},
+        )
+        mocker.patch.object(controller.Controller, '_micropath_root', root)
+        req = mocker.Mock(**{
+            'path_info': '/a/b/c/',
+            'script_name': '/base',
+            'urlvars': {},
+        })
+        inj = injector.Injector()
+        obj = controller.Controller()
+
+        result = obj._micropath_resolve(req, inj)
+
+        assert result == (target, False)
+        assert req.script_name == '/base/a/b/c'
+        assert req.path_info == '/'
+
+    def test_micropath_resolve_chain_mismatch(self, mocker):
+        child = mocker.Mock(paths={}, chains={}, bindings=None)
+        root = mocker.Mock(
+            paths={'a': child},
+            chains={'a': ('a/b/c', mocker.Mock())},
+            bindings=None,
+            statics={},
+        )
+        mocker.patch.object(controller.Controller, '_micropath_root', root)
+        req = mocker.Mock(**{
+            'path_info': '/a/bc',
+            'script_name': '/base',
+            'urlvars': {},
+        })
+        inj = injector.Injector()
+        obj = controller.Controller()
+
+        result = obj._micropath_resolve(req, inj)
+
+        assert result == (child, True)
+        assert req.script_name == '/base/a'
+        assert req.path_info == '/bc'
+
     def test_micropath_delegation_base(self, mocker):
         req = mocker.Mock(method='GET')
         meth = mocker.Mock()
-        elem = mocker.Mock(methods={'GET': meth})
+        elem = mocker.Mock(methods={'GET': meth}, default_method=None)
         obj = controller.Controller()
 
         result = obj._micropath_delegation(req, elem)
@@ -1075,7 +1329,7 @@ class TestController(object):
     def test_micropath_delegation_elem_delegation(self, mocker):
         req = mocker.Mock(method='GET')
         meth = mocker.Mock(delegation=None)
-        elem = mocker.Mock(methods={'GET': meth})
+        elem = mocker.Mock(methods={'GET': meth}, default_method=None)
         obj = controller.Controller()
 
         result = obj._micropath_delegation(req, elem)
@@ -1085,7 +1339,7 @@ class TestController(object):
     def test_micropath_delegation_head(self, mocker):
         req = mocker.Mock(method='HEAD')
         meth = mocker.Mock()
-        elem = mocker.Mock(methods={'GET': meth})
+        elem = mocker.Mock(methods={'GET': meth}, default_method=None)
         obj = controller.Controller()
 
         result = obj._micropath_delegation(req, elem)
@@ -1095,7 +1349,21 @@ class TestController(object):
     def test_micropath_delegation_none(self, mocker):
         req = mocker.Mock(method='GET')
         meth = mocker.Mock()
-        elem = mocker.Mock(methods={None: meth})
+        elem = mocker.Mock(methods={None: meth}, default_method=meth)
+        obj = controller.Controller()
+
+        result = obj._micropath_delegation(req, elem)
+
+        assert result == (meth.func, meth.delegation)
+
+    def test_micropath_delegation_override_default(self, mocker):
+        req = mocker.Mock(method='GET')
+        meth = mocker.Mock()
+        default = mocker.Mock()
+        elem = mocker.Mock(
+            methods={'GET': meth, None: default},
+            default_method=default,
+        )
         obj = controller.Controller()
 
         result = obj._micropath_delegation(req, elem)
@@ -1104,7 +1372,7 @@ class TestController(object):
 
     def test_micropath_delegation_no_method(self, mocker):
         req = mocker.Mock(method='GET')
-        elem = mocker.Mock(methods={})
+        elem = mocker.Mock(methods={}, default_method=None)
         obj = controller.Controller()
 
         result = obj._micropath_delegation(req, elem)
@@ -1112,7 +1380,8 @@ class TestController(object):
         assert result == (None, elem.delegation)
 
     def test_micropath_methods_base(self, mocker):
-        elem = mocker.Mock(methods={'POST': 'poster'})
+        elem = mocker.Mock(routed_methods=frozenset(['POST']),
+                           default_method=None)
         obj = controller.Controller()
 
         result = obj._micropath_methods(elem)
@@ -1120,7 +1389,8 @@ class TestController(object):
         assert result == set(['POST', 'OPTIONS'])
 
     def test_micropath_methods_with_get(self, mocker):
-        elem = mocker.Mock(methods={'POST': 'poster', 'GET': 'getter'})
+        elem = mocker.Mock(routed_methods=frozenset(['POST', 'GET']),
+                           default_method=None)
         obj = controller.Controller()
 
         result = obj._micropath_methods(elem)
@@ -1128,7 +1398,8 @@ class TestController(object):
         assert result == set(['POST', 'OPTIONS', 'GET', 'HEAD'])
 
     def test_micropath_methods_all(self, mocker):
-        elem = mocker.Mock(methods={None: 'method'})
+        elem = mocker.Mock(routed_methods=frozenset(),
+                           default_method='method')
         obj = controller.Controller()
 
         result = obj._micropath_methods(elem)
@@ -1136,7 +1407,8 @@ class TestController(object):
         assert result == controller.Controller.micropath_methods
 
     def test_micropath_methods_all_extra(self, mocker):
-        elem = mocker.Mock(methods={None: 'method', 'PATCH': 'patcher'})
+        elem = mocker.Mock(routed_methods=frozenset(['PATCH']),
+                           default_method='method')
         obj = controller.Controller()
 
         result = obj._micropath_methods(elem)
@@ -12,6 +12,9 @@
 # implied. See the License for the specific language governing
 # permissions and limitations under the License.
 
+import gc
+import weakref
+
 import pytest
 
 from micropath import elements
@@ -27,6 +30,10 @@ class OtherElement(elements.Element):
         pass
 
 
+class TargetForTest(object):
+    pass
+
+
 class TestElement(object):
     def test_init_base(self):
         result = ElementForTest('ident')
@@ -37,6 +44,8 @@ class TestElement(object):
         assert result.bindings is None
         assert result.methods == {}
         assert result.delegation is None
+        assert result.chains == {}
+        assert result.paths is not result.methods
 
     def test_init_alt(self):
         result = ElementForTest('ident', 'parent')
@@ -203,8 +212,8 @@ class TestElement(object):
 
     def test_route_with_methods(self, mocker):
         methods = {
-            'get': mocker.Mock(ident='get'),
-            'put': mocker.Mock(ident='put'),
+            'GET': mocker.Mock(ident='GET'),
+            'PUT': mocker.Mock(ident='PUT'),
         }
         mock_Method = mocker.patch.object(
             elements, 'Method',
@@ -228,8 +237,8 @@ class TestElement(object):
 
         assert result == func
         mock_Method.assert_has_calls([
-            mocker.call('get', func, parent=obj),
-            mocker.call('put', func, parent=obj),
+            mocker.call('GET', func, parent=obj),
+            mocker.call('PUT', func, parent=obj),
         ])
         assert mock_Method.call_count == 2
         mock_from_func.assert_called_once_with(func)
@@ -239,8 +248,8 @@ class TestElement(object):
 
     def test_route_with_methods_internal_duplicate(self, mocker):
         methods = {
-            'get': mocker.Mock(ident='get'),
-            'put': mocker.Mock(ident='put'),
+            'GET': mocker.Mock(ident='GET'),
+            'PUT': mocker.Mock(ident='PUT'),
         }
         mock_Method = mocker.patch.object(
             elements, 'Method',
@@ -252,7 +261,7 @@ class TestElement(object):
         obj = ElementForTest('ident')
         func = mocker.Mock(_micropath_handler=False)
 
-        decorator = obj.route('get', 'put', 'get')
+        decorator = obj.route('get', 'put', 'GET')
 
         assert callable(decorator)
         assert decorator != func
@@ -264,8 +273,8 @@ class TestElement(object):
 
         assert result == func
         mock_Method.assert_has_calls([
-            mocker.call('get', func, parent=obj),
-            mocker.call('put', func, parent=obj),
+            mocker.call('GET', func, parent=obj),
+            mocker.call('PUT', func, parent=obj),
         ])
         assert mock_Method.call_count == 2
         mock_from_func.assert_called_once_with(func)
@@ -275,8 +284,8 @@ class TestElement(object):
 
     def test_route_with_methods_external_duplicate(self, mocker):
         methods = {
-            'get': mocker.Mock(ident='get'),
-            'put': mocker.Mock(ident='put'),
+            'GET': mocker.Mock(ident='GET'),
+            'PUT': mocker.Mock(ident='PUT'),
         }
         mock_Method = mocker.patch.object(
             elements, 'Method',
@@ -286,13 +295,13 @@ class TestElement(object):
             elements.injector.WantSignature, 'from_func',
         )
         obj = ElementForTest('ident')
-        obj.methods['get'] = 'conflict'
+        obj.methods['GET'] = 'conflict'
 
         with pytest.raises(ValueError):
             obj.route('get', 'put')
         mock_Method.assert_not_called()
         mock_from_func.assert_not_called()
-        assert obj.methods == {'get': 'conflict'}
+        assert obj.methods == {'GET': 'conflict'}
 
     def test_mount_base(self, mocker):
         mock_init = mocker.patch.object(
@@ -316,8 +325,8 @@ class TestElement(object):
 
     def test_mount_with_methods(self, mocker):
         methods = {
-            'get': mocker.Mock(ident='get', delegation=None),
-            'put': mocker.Mock(ident='put', delegation=None),
+            'GET': mocker.Mock(ident='GET', delegation=None),
+            'PUT': mocker.Mock(ident='PUT', delegation=None),
         }
         mock_init = mocker.patch.object(
             elements.Delegation, '__init__',
@@ -339,15 +348,15 @@ class TestElement(object):
         assert obj.delegation is None
         mock_init.assert_called_once_with('delegation', {'a': 1, 'b': 2})
         mock_Method.assert_has_calls([
-            mocker.call('get', None, parent=obj),
-            mocker.call('put', None, parent=obj),
+            mocker.call('GET', None, parent=obj),
+            mocker.call('PUT', None, parent=obj),
         ])
         assert mock_Method.call_count == 2
 
     def test_mount_with_methods_internal_duplication(self, mocker):
         methods = {
-            'get': mocker.Mock(ident='get', delegation=None),
-            'put': mocker.Mock(ident='put', delegation=None),
+            'GET': mocker.Mock(ident='GET', delegation=None),
+            'PUT': mocker.Mock(ident='PUT', delegation=None),
         }
         mock_init = mocker.patch.object(
             elements.Delegation, '__init__',
@@ -359,7 +368,7 @@ class TestElement(object):
         )
         obj = ElementForTest('ident')
 
-        result = obj.mount('delegation', 'get', 'put', 'get', a=1, b=2)
+        result = obj.mount('delegation', 'get', 'put', 'GET', a=1, b=2)
 
         assert isinstance(result, elements.Delegation)
         assert result.element == obj
@@ -369,15 +378,15 @@ class TestElement(object):
         assert obj.delegation is None
         mock_init.assert_called_once_with('delegation', {'a': 1, 'b': 2})
         mock_Method.assert_has_calls([
-            mocker.call('get', None, parent=obj),
-            mocker.call('put', None, parent=obj),
+            mocker.call('GET', None, parent=obj),
+            mocker.call('PUT', None, parent=obj),
         ])
         assert mock_Method.call_count == 2
 
     def test_mount_with_methods_external_duplication(self, mocker):
         methods = {
-            'get': mocker.Mock(ident='get', delegation=None),
-            'put': mocker.Mock(ident='put', delegation=None),
+            'GET': mocker.Mock(ident='GET', delegation=None),
+            'PUT': mocker.Mock(ident='PUT', delegation=None),
         }
         mock_init = mocker.patch.object(
             elements.Delegation, '__init__',
@@ -388,11 +397,11 @@ class TestElement(object):
             side_effect=lambda x, f, parent: methods[x],
         )
         obj = ElementForTest('ident')
-        obj.methods['get'] = 'conflict'
+        obj.methods['GET'] = 'conflict'
 
         with pytest.raises(ValueError):
             obj.mount('delegation', 'get', 'put', a=1, b=2)
-        assert obj.methods == {'get': 'conflict'}
+        assert obj.methods == {'GET': 'conflict'}
         for meth in methods.values():
             assert meth.delegation is None
         assert obj.delegation is None
@@ -611,6 +620,18 @@ class TestRoot(object):
         assert elem.parent is None
         elem.set_ident.assert_not_called()
 
+    def test_add_elem_loop(self, mocker):
+        elem = mocker.Mock(spec=elements.Path, ident='spam')
+        elem.parent = elem
+        obj = elements.Root()
+
+        with pytest.raises(RuntimeError):
+            obj.add_elem(elem)
+        assert obj.paths == {}
+        assert obj.bindings is None
+        assert obj.methods == {}
+        assert elem.parent is elem
+
     def test_add_elem_path_no_ident(self, mocker):
         elem = mocker.Mock(spec=elements.Path, ident=None)
         elem.parent = None
@@ -653,6 +674,16 @@ class TestRoot(object):
         assert elem.parent is obj
         elem.set_ident.assert_called_once_with('spam')
 
+    def test_add_elem_set_empty_ident(self):
+        elem = elements.Path('')
+        obj = elements.Root()
+
+        obj.add_elem(elem, 'spam')
+
+        assert obj.paths == {'spam': elem}
+        assert elem.ident == 'spam'
+        assert elem.parent is obj
+
     def test_add_elem_parents(self, mocker):
         elem = mocker.Mock(spec=elements.Path, ident='spam')
         elem.parent = None
@@ -670,8 +701,114 @@ class TestRoot(object):
         elem.set_ident.assert_not_called()
         descendant.set_ident.assert_called_once_with('descendant')
 
+    def test_compress(self):
+        obj = elements.Root()
+        a = obj.path('a')
+        b = a.path('b')
+        c = b.path('c')
+        c.route('GET')(lambda: None)
+        d = c.path('d')
+        d.path('e')
+        x = obj.path('x')
+        y = x.bind('y')
+        y.path('z').path('w')
+
+        obj.compress()
+
+        assert obj.chains == {'a': ('a/b/c', c)}
+        assert a.chains == {'b': ('b/c', c)}
+        assert b.chains == {}
+        assert c.chains == {'d': ('d/e', d.paths['e'])}
+        assert d.chains == {}
+        assert x.chains == {}
+        assert y.chains == {'z': ('z/w', y.paths['z'].paths['w'])}
+
+    def test_compress_slash(self):
+        obj = elements.Root()
+        a = obj.path('a')
+        b = a.path('b/c')
+        b.path('d')
+
+        obj.compress()
+
+        assert obj.chains == {}
+        assert a.chains == {}
+        assert b.chains == {}
+
+    def test_compress_empty(self):
+        obj = elements.Root()
+        a = obj.path('a')
+        b = elements.Path(None, a)
+        b.ident = ''
+        a.paths[''] = b
+        b.path('c')
+        d = elements.Path(None, obj)
+        d.ident = ''
+        obj.paths[''] = d
+        d.path('e')
+
+        obj.compress()
+
+        assert obj.chains == {}
+        assert a.chains == {}
+        assert b.chains == {}
+        assert d.chains == {}
+
+    def test_index_statics(self):
+        obj = elements.Root()
+        a = obj.path('a')
+        b = a.path('b')
+        a.bind('c').path('d')
+        e = obj.path('e')
+        f = e.path('f/g')
+        f.path('h')
+
+        obj.index_statics()
+
+        assert obj.statics == {
+            '/a': a,
+            '/a/b': b,
+            '/e': e,
+        }
+
+    def test_index_statics_empty(self):
+        obj = elements.Root()
+        a = obj.path('a')
+        b = elements.Path(None, obj)
+        b.ident = ''
+        obj.paths[''] = b
+        b.path('c')
+
+        obj.index_statics()
+
+        assert obj.statics == {
+            '/a': a,
+        }
+
+    def test_index_methods(self):
+        obj = elements.Root()
+        a = obj.path('a')
+        a.route('get', 'put')(lambda: None)
+        c = a.bind('c')
+        c.route()(lambda: None)
+        c.route('delete')(lambda: None)
+
+        obj.index_methods()
+
+        assert obj.routed_methods == frozenset()
+        assert a.routed_methods == frozenset(['GET', 'PUT'])
+        assert c.routed_methods == frozenset(['DELETE'])
+        assert obj.default_method is None
+        assert a.default_method is None
+        assert c.default_method is c.methods[None]
+
 
 class TestPath(object):
+    def test_slots(self):
+        obj = elements.Path('ident')
+
+        assert not hasattr(obj, '__dict__')
+
     def test_set_ident_no_parent(self, mocker):
         mock_set_ident = mocker.patch.object(elements.Element, 'set_ident')
         obj = elements.Path(None)
@@ -822,6 +959,14 @@ class TestBinding(object):
 
         assert result == '1234'
 
+    def test_format_unset_str(self):
+        obj = elements.Binding('ident')
+        value = 'spam'
+
+        result = obj.format('controller', value)
+
+        assert result is value
+
     def test_format_set(self, mocker):
         obj = elements.Binding('ident')
         obj._formatter = mocker.Mock(return_value='string')
@@ -844,6 +989,20 @@ class TestMethod(object):
         assert result.func == 'func'
         mock_init.assert_called_once_with('GET', None)
 
+    def test_init_leaf(self):
+        result = elements.Method('get', 'func')
+
+        assert result.paths is elements._empty
+        assert result.methods is elements._empty
+        assert result.chains is elements._empty
+        assert result.bindings is None
+        assert result.delegation is None
+
+    def test_init_interned(self):
+        result = elements.Method(''.join(['p', 'atch']), 'func')
+
+        assert result.ident is elements.Method('PATCH', 'func').ident
+
     def test_init_alt(self, mocker):
         mock_init = mocker.patch.object(
             elements.Element, '__init__',
@@ -914,7 +1073,7 @@ class TestDelegation(object):
         assert result.controller == 'controller'
         assert result.kwargs == 'kwargs'
         assert result.element is None
-        assert result._cache == {}
+        assert not hasattr(result, '__dict__')
 
     def test_dunder_get_class(self, mocker):
         mock_get = mocker.patch.object(elements.Delegation, 'get')
@@ -927,64 +1086,104 @@ class TestDelegation(object):
 
     def test_dunder_get_object(self, mocker):
         mock_get = mocker.patch.object(elements.Delegation, 'get')
+        target = TargetForTest()
+        obj = elements.Delegation('controller', {})
+
+        result = obj.__get__(target, 'class')
+
+        assert result == mock_get.return_value
+        mock_get.assert_called_once_with(target)
+
+    def test_dunder_get_object_other_cached(self, mocker):
+        mock_get = mocker.patch.object(elements.Delegation, 'get')
+        target = TargetForTest()
+        target._micropath_delegates = {'other': 'value'}
         obj = elements.Delegation('controller', {})
 
-        result = obj.__get__('object', 'class')
+        result = obj.__get__(target, 'class')
 
         assert result == mock_get.return_value
-        mock_get.assert_called_once_with('object')
+        mock_get.assert_called_once_with(target)
+
+    def test_dunder_get_object_cached(self, mocker):
+        mock_get = mocker.patch.object(elements.Delegation, 'get')
+        target = TargetForTest()
+        obj = elements.Delegation('controller', {})
+        target._micropath_delegates = {obj: 'value'}
+
+        result = obj.__get__(target, 'class')
+
+        assert result == 'value'
+        mock_get.assert_not_called()
 
     def test_set(self):
-        target = object()
+        target = TargetForTest()
         obj = elements.Delegation('controller', {})
 
         obj.__set__(target, 'value')
 
-        assert obj._cache == {id(target): 'value'}
+        assert target._micropath_delegates == {obj: 'value'}
 
     def test_delete_exists(self):
-        target = object()
+        target = TargetForTest()
         obj = elements.Delegation('controller', {})
-        obj._cache = {id(target): 'value'}
+        target._micropath_delegates = {obj: 'value'}
 
         obj.__delete__(target)
 
-        assert obj._cache == {}
+        assert target._micropath_delegates == {}
 
     def test_delete_missing(self):
-        target = object()
+        target = TargetForTest()
         obj = elements.Delegation('controller', {})
 
         obj.__delete__(target)
 
-        assert obj._cache == {}
+        assert not hasattr(target, '_micropath_delegates')
 
     def test_get_cached(self, mocker):
         mock_construct = mocker.patch.object(elements.Delegation, 'construct')
-        target = object()
+        target = TargetForTest()
         obj = elements.Delegation('controller', {})
-        obj._cache = {id(target): 'value'}
+        target._micropath_delegates = {obj: 'value'}
 
         result = obj.get(target)
 
         assert result == 'value'
-        assert obj._cache == {id(target): 'value'}
+        assert target._micropath_delegates == {obj: 'value'}
         mock_construct.assert_not_called()
 
     def test_get_uncached(self, mocker):
         mock_construct = mocker.patch.object(elements.Delegation, 'construct')
-        target = object()
+        target = TargetForTest()
         obj = elements.Delegation('controller', {})
         obj.element = 'element'
 
         result = obj.get(target)
 
         assert result == mock_construct.return_value
-        assert obj._cache == {id(target): mock_construct.return_value}
+        assert target._micropath_delegates == {
+            obj: mock_construct.return_value,
+        }
         assert mock_construct.return_value._micropath_parent is target
         assert mock_construct.return_value._micropath_elem == 'element'
         mock_construct.assert_called_once_with(target)
 
+    def test_get_released(self):
+        class DelegationForTest(elements.Delegation):
+            def construct(self, obj):
+                return TargetForTest()
+
+        target = TargetForTest()
+        obj = DelegationForTest('controller', {})
+        obj.get(target)
+        ref = weakref.ref(target)
+
+        del target
+        gc.collect()
+
+        assert ref() is None
+
     def test_construct(self, mocker):
         target = mocker.Mock()
         obj = elements.Delegation('controller', 'kwargs')
@@ -1083,8 +1282,8 @@ class TestRoute(object):
 
     def test_with_methods(self, mocker):
         methods = {
-            'get': mocker.Mock(ident='get'),
-            'put': mocker.Mock(ident='put'),
+            'GET': mocker.Mock(ident='GET'),
+            'PUT': mocker.Mock(ident='PUT'),
         }
         mock_Method = mocker.patch.object(
             elements, 'Method',
@@ -1108,18 +1307,18 @@ class TestRoute(object):
 
         assert result == func
         mock_Method.assert_has_calls([
-            mocker.call('get', func),
-            mocker.call('put', func),
+            mocker.call('GET', func),
+            mocker.call('PUT', func),
         ])
         assert mock_Method.call_count == 2
         mock_from_func.assert_called_once_with(func)
-        assert func._micropath_methods == [methods[x] for x in ('get', 'put')]
+        assert func._micropath_methods == [methods[x] for x in ('GET', 'PUT')]
         assert func._micropath_handler is True
 
     def test_with_methods_internal_duplicate(self, mocker):
         methods = {
-            'get': mocker.Mock(ident='get'),
-            'put': mocker.Mock(ident='put'),
+            'GET': mocker.Mock(ident='GET'),
+            'PUT': mocker.Mock(ident='PUT'),
         }
         mock_Method = mocker.patch.object(
             elements, 'Method',
@@ -1130,7 +1329,7 @@ class TestRoute(object):
         )
         func = mocker.Mock(_micropath_methods=None, _micropath_handler=False)
 
-        decorator = elements.route('get', 'put', 'get')
+        decorator = elements.route('get', 'put', 'GET')
 
         assert callable(decorator)
         assert decorator != func
@@ -1143,12 +1342,12 @@ class TestRoute(object):
 
         assert result == func
         mock_Method.assert_has_calls([
-            mocker.call('get', func),
-            mocker.call('put', func),
+            mocker.call('GET', func),
+            mocker.call('PUT', func),
         ])
         assert mock_Method.call_count == 2
         mock_from_func.assert_called_once_with(func)
-        assert func._micropath_methods == [methods[x] for x in ('get', 'put')]
+        assert func._micropath_methods == [methods[x] for x in ('GET', 'PUT')]
         assert func._micropath_handler is True
 
 
@@ -1172,8 +1371,8 @@ class TestMount(object):
 
     def test_with_methods(self, mocker):
         methods = {
-            'get': mocker.Mock(ident='get', delegation=None),
-            'put': mocker.Mock(ident='put', delegation=None),
+            'GET': mocker.Mock(ident='GET', delegation=None),
+            'PUT': mocker.Mock(ident='PUT', delegation=None),
         }
         mock_init = mocker.patch.object(
             elements.Delegation, '__init__',
@@ -1187,17 +1386,17 @@ class TestMount(object):
         result = elements.mount('delegation', 'get', 'put', a=1, b=2)
 
         assert isinstance(result, elements.Delegation)
-        assert result._micropath_methods == [methods['get'], methods['put']]
+        assert result._micropath_methods == [methods['GET'], methods['PUT']]
         mock_init.assert_called_once_with('delegation', {'a': 1, 'b': 2})
         mock_Method.assert_has_calls([
-            mocker.call('get', None),
-            mocker.call('put', None),
+            mocker.call('GET', None),
+            mocker.call('PUT', None),
         ])
 
     def test_with_methods_internal_duplication(self, mocker):
         methods = {
-            'get': mocker.Mock(ident='get', delegation=None),
-            'put': mocker.Mock(ident='put', delegation=None),
+            'GET': mocker.Mock(ident='GET', delegation=None),
+            'PUT': mocker.Mock(ident='PUT', delegation=None),
         }
         mock_init = mocker.patch.object(
             elements.Delegation, '__init__',
@@ -1208,14 +1407,14 @@ class TestMount(object):
             side_effect=lambda x, f: methods[x],
         )
 
-        result = elements.mount('delegation', 'get', 'put', 'get', a=1, b=2)
+        result = elements.mount('delegation', 'get', 'put', 'GET', a=1, b=2)
 
         assert isinstance(result, elements.Delegation)
-        assert result._micropath_methods == [methods['get'], methods['put']]
+        assert result._micropath_methods == [methods['GET'], methods['PUT']]
         mock_init.assert_called_once_with('delegation', {'a': 1, 'b': 2})
         mock_Method.assert_has_calls([
-            mocker.call('get', None),
-            mocker.call('put', None),
+            mocker.call('GET', None),
+            mocker.call('PUT', None),
         ])
 
     def test_delegation(self, mocker):
@@ -16,254 +16,162 @@ import functools
 import inspect
 
 import pytest
-import six
 
 from micropath import injector
 
 
 class TestWantSignature(object):
-    if six.PY2:
-        def test_py2_getsig_noargs(self, mocker):
-            argspec = inspect.ArgSpec([], None, None, None)
-            mock_getargspec = mocker.patch.object(
-                injector.inspect, 'getargspec',
-                return_value=argspec,
-            )
-
-            result = injector.WantSignature._getsig('func')
-
-            assert result == (
-                [],
-                set(),
-                set(),
-                False,
-                False,
-            )
-            mock_getargspec.assert_called_once_with('func')
-
-        def test_py2_getsig_withargs_nodefaults(self, mocker):
-            argspec = inspect.ArgSpec(['a', 'b', 'c'], None, None, None)
-            mock_getargspec = mocker.patch.object(
-                injector.inspect, 'getargspec',
-                return_value=argspec,
-            )
-
-            result = injector.WantSignature._getsig('func')
-
-            assert result == (
-                ['a', 'b', 'c'],
-                set(['a', 'b', 'c']),
-                set(),
-                False,
-                False,
-            )
-            mock_getargspec.assert_called_once_with('func')
-
-        def test_py2_getsig_withargs_withdefaults(self, mocker):
-            argspec = inspect.ArgSpec(['a', 'b', 'c'], None, None, (2, 3))
-            mock_getargspec = mocker.patch.object(
-                injector.inspect, 'getargspec',
-                return_value=argspec,
-            )
-
-            result = injector.WantSignature._getsig('func')
-
-            assert result == (
-                ['a', 'b', 'c'],
-                set(['a']),
-                set(['b', 'c']),
-                False,
-                False,
-            )
-            mock_getargspec.assert_called_once_with('func')
-
-        def test_py2_getsig_allposargs(self, mocker):
-            argspec = inspect.ArgSpec(['a', 'b', 'c'], 'd', None, (2, 3))
-            mock_getargspec = mocker.patch.object(
-                injector.inspect, 'getargspec',
-                return_value=argspec,
-            )
-
-            result = injector.WantSignature._getsig('func')
-
-            assert result == (
-                ['a', 'b', 'c'],
-                set(['a']),
-                set(['b', 'c']),
-                True,
-                False,
-            )
-            mock_getargspec.assert_called_once_with('func')
-
-        def test_py2_getsig_allkwargs(self, mocker):
-            argspec = inspect.ArgSpec(['a', 'b', 'c'], None, 'e', (2, 3))
-            mock_getargspec = mocker.patch.object(
-                injector.inspect, 'getargspec',
-                return_value=argspec,
-            )
-
-            result = injector.WantSignature._getsig('func')
-
-            assert result == (
-                ['a', 'b', 'c'],
-                set(['a']),
-                set(['b', 'c']),
-                False,
-                True,
-            )
-            mock_getargspec.assert_called_once_with('func')
-    else:  # Python 3
-        def test_py3_getsig_noargs(self, mocker):
-            signature = inspect.Signature(parameters=[])
-            mock_signature = mocker.patch.object(
-                injector.inspect, 'signature',
-                return_value=signature,
-            )
+    def test_getsig_noargs(self, mocker):
+        signature = inspect.Signature(parameters=[])
+        mock_signature = mocker.patch.object(
+            injector.inspect, 'signature',
+            return_value=signature,
+        )
 
-            result = injector.WantSignature._getsig('func')
+        result = injector.WantSignature._getsig('func')
 
-            assert result == (
-                [],
-                set(),
-                set(),
-                False,
-                False,
-            )
-            mock_signature.assert_called_once_with(
-                'func',
-                follow_wrapped=False,
-            )
+        assert result == (
+            [],
+            set(),
+            set(),
+            False,
+            False,
+        )
+        mock_signature.assert_called_once_with(
+            'func',
+            follow_wrapped=False,
+        )
 
-        def test_py3_getsig_withargs_nodefaults(self, mocker):
-            signature = inspect.Signature(parameters=[
-                inspect.Parameter('a', inspect.Parameter.POSITIONAL_ONLY),
-                inspect.Parameter(
-                    'b', inspect.Parameter.POSITIONAL_OR_KEYWORD,
-                ),
-                inspect.Parameter('c', inspect.Parameter.KEYWORD_ONLY),
-            ])
-            mock_signature = mocker.patch.object(
-                injector.inspect, 'signature',
-                return_value=signature,
-            )
+    def test_getsig_withargs_nodefaults(self, mocker):
+        signature = inspect.Signature(parameters=[
+            inspect.Parameter('a', inspect.Parameter.POSITIONAL_ONLY),
+            inspect.Parameter(
+                'b', inspect.Parameter.POSITIONAL_OR_KEYWORD,
+            ),
+            inspect.Parameter('c', inspect.Parameter.KEYWORD_ONLY),
+        ])
+        mock_signature = mocker.patch.object(
+            injector.inspect, 'signature',
+            return_value=signature,
+        )
 
-            result = injector.WantSignature._getsig('func')
+        result = injector.WantSignature._getsig('func')
 
-            assert result == (
-                ['a', 'b'],
-                set(['b', 'c']),
-                set(),
-                False,
-                False,
-            )
-            mock_signature.assert_called_once_with(
-                'func',
-                follow_wrapped=False,
-            )
+        assert result == (
+            ['a', 'b'],
+            set(['b', 'c']),
+            set(),
+            False,
+            False,
+        )
+        mock_signature.assert_called_once_with(
+            'func',
+            follow_wrapped=False,
+        )
 
-        def test_py3_getsig_withargs_withdefaults(self, mocker):
-            signature = inspect.Signature(parameters=[
-                inspect.Parameter('a', inspect.Parameter.POSITIONAL_ONLY),
-                inspect.Parameter(
-                    'b', inspect.Parameter.POSITIONAL_OR_KEYWORD,
-                ),
-                inspect.Parameter(
-                    'c', inspect.Parameter.POSITIONAL_OR_KEYWORD,
-                    default=3,
-                ),
-                inspect.Parameter(
-                    'd', inspect.Parameter.KEYWORD_ONLY,
-                    default=4,
-                ),
-            ])
-            mock_signature = mocker.patch.object(
-                injector.inspect, 'signature',
-                return_value=signature,
-            )
+    def test_getsig_withargs_withdefaults(self, mocker):
+        signature = inspect.Signature(parameters=[
+            inspect.Parameter('a', inspect.Parameter.POSITIONAL_ONLY),
+            inspect.Parameter(
+                'b', inspect.Parameter.POSITIONAL_OR_KEYWORD,
+            ),
+            inspect.Parameter(
+                'c', inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                default=3,
+            ),
+            inspect.Parameter(
+                'd', inspect.Parameter.KEYWORD_ONLY,
+                default=4,
+            ),
+        ])
+        mock_signature = mocker.patch.object(
+            injector.inspect, 'signature',
+            return_value=signature,
+        )
 
-            result = injector.WantSignature._getsig('func')
+        result = injector.WantSignature._getsig('func')
 
-            assert result == (
-                ['a', 'b', 'c'],
-                set(['b']),
-                set(['c', 'd']),
-                False,
-                False,
-            )
-            mock_signature.assert_called_once_with(
-                'func',
-                follow_wrapped=False,
-            )
+        assert result == (
+            ['a', 'b', 'c'],
+            set(['b']),
+            set(['c', 'd']),
+            False,
+            False,
+        )
+        mock_signature.assert_called_once_with(
+            'func',
+            follow_wrapped=False,
+        )
 
-        def test_py3_getsig_allposargs(self, mocker):
-            signature = inspect.Signature(parameters=[
-                inspect.Parameter('a', inspect.Parameter.POSITIONAL_ONLY),
-                inspect.Parameter(
-                    'b', inspect.Parameter.POSITIONAL_OR_KEYWORD,
-                ),
-                inspect.Parameter(
-                    'c', inspect.Parameter.POSITIONAL_OR_KEYWORD,
-                    default=3,
-                ),
-                inspect.Parameter('d', inspect.Parameter.VAR_POSITIONAL),
-                inspect.Parameter(
-                    'e', inspect.Parameter.KEYWORD_ONLY,
-                    default=4,
-                ),
-            ])
-            mock_signature = mocker.patch.object(
-                injector.inspect, 'signature',
-                return_value=signature,
-            )
+    def test_getsig_allposargs(self, mocker):
+        signature = inspect.Signature(parameters=[
+            inspect.Parameter('a', inspect.Parameter.POSITIONAL_ONLY),
+            inspect.Parameter(
+                'b', inspect.Parameter.POSITIONAL_OR_KEYWORD,
+            ),
+            inspect.Parameter(
+                'c', inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                default=3,
+            ),
+            inspect.Parameter('d', inspect.Parameter.VAR_POSITIONAL),
+            inspect.Parameter(
+                'e', inspect.Parameter.KEYWORD_ONLY,
+                default=4,
+            ),
+        ])
+        mock_signature = mocker.patch.object(
+            injector.inspect, 'signature',
+            return_value=signature,
+        )
 
-            result = injector.WantSignature._getsig('func')
+        result = injector.WantSignature._getsig('func')
 
-            assert result == (
-                ['a', 'b', 'c'],
-                set(['b']),
-                set(['c', 'e']),
-                True,
-                False,
-            )
-            mock_signature.assert_called_once_with(
-                'func',
-                follow_wrapped=False,
-            )
+        assert result == (
+            ['a', 'b', 'c'],
+            set(['b']),
+            set(['c', 'e']),
+            True,
+            False,
+        )
+        mock_signature.assert_called_once_with(
+            'func',
+            follow_wrapped=False,
+        )
 
-        def test_py3_getsig_allkwargs(self, mocker):
-            signature = inspect.Signature(parameters=[
-                inspect.Parameter('a', inspect.Parameter.POSITIONAL_ONLY),
-                inspect.Parameter(
-                    'b', inspect.Parameter.POSITIONAL_OR_KEYWORD,
-                ),
-                inspect.Parameter(
-                    'c', inspect.Parameter.POSITIONAL_OR_KEYWORD,
-                    default=3,
-                ),
-                inspect.Parameter(
-                    'd', inspect.Parameter.KEYWORD_ONLY,
-                    default=4,
-                ),
-                inspect.Parameter('e', inspect.Parameter.VAR_KEYWORD),
-            ])
-            mock_signature = mocker.patch.object(
-                injector.inspect, 'signature',
-                return_value=signature,
-            )
+    def test_getsig_allkwargs(self, mocker):
+        signature = inspect.Signature(parameters=[
+            inspect.Parameter('a', inspect.Parameter.POSITIONAL_ONLY),
+            inspect.Parameter(
+                'b', inspect.Parameter.POSITIONAL_OR_KEYWORD,
+            ),
+            inspect.Parameter(
+                'c', inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                default=3,
+            ),
+            inspect.Parameter(
+                'd', inspect.Parameter.KEYWORD_ONLY,
+                default=4,
+            ),
+            inspect.Parameter('e', inspect.Parameter.VAR_KEYWORD),
+        ])
+        mock_signature = mocker.patch.object(
+            injector.inspect, 'signature',
+            return_value=signature,
+        )
 
-            result = injector.WantSignature._getsig('func')
+        result = injector.WantSignature._getsig('func')
 
-            assert result == (
-                ['a', 'b', 'c'],
-                set(['b']),
-                set(['c', 'd']),
-                False,
-                True,
-            )
-            mock_signature.assert_called_once_with(
-                'func',
-                follow_wrapped=False,
-            )
+        assert result == (
+            ['a', 'b', 'c'],
+            set(['b']),
+            set(['c', 'd']),
+            False,
+            True,
+        )
+        mock_signature.assert_called_once_with(
+            'func',
+            follow_wrapped=False,
+        )
 
     def test_from_func_cached(self, mocker):
         mock_getsig = mocker.patch.object(
@@ -495,6 +403,7 @@ class TestWantSignature(object):
 
         assert result == func.return_value
         func.assert_called_once_with('self', a=1, b=2, c=3)
+        assert obj.all_args == set(['self', 'a', 'b', 'c'])
 
     def test_call_too_many_positional(self, mocker):
         func = mocker.Mock()
@@ -553,6 +462,26 @@ class TestWantSignature(object):
         assert result == func.return_value
         func.assert_called_once_with(a=1, b='b', c=3, d=4, e=5, f='f')
 
+    def test_call_all_kw_injector(self, mocker):
+        func = mocker.Mock()
+        obj = injector.WantSignature(
+            func, ['a', 'b', 'c'], set(['a']), set(['b', 'c']),
+            False, True,
+        )
+        inj = injector.Injector()
+        inj['a'] = 1
+        inj['d'] = 4
+        inj.set_deferred_template({
+            'b': lambda: 2,
+            'e': mocker.Mock(side_effect=AssertionError()),
+        })
+
+        result = obj((), inj)
+
+        assert result == func.return_value
+        func.assert_called_once_with(a=1, b=2, d=4)
+        assert obj.all_args == set(['a', 'b', 'c'])
+
     def test_call_missing(self, mocker):
         func = mocker.Mock()
         obj = injector.WantSignature(
@@ -571,9 +500,15 @@ class TestInjectorCleanup(object):
 
         assert result.injector == 'injector'
         assert result.keep is None
+        assert result.template is None
+        assert result.masked is None
 
     def test_enter(self, mocker):
-        inject = mocker.Mock(_keys=set(['a', 'b', 'c']))
+        inject = mocker.Mock(
+            _keys=set(['a', 'b', 'c']),
+            _template={'d': 'func'},
+            _masked=set(['d']),
+        )
         obj = injector.InjectorCleanup(inject)
 
         result = obj.__enter__()
@@ -581,16 +516,28 @@ class TestInjectorCleanup(object):
         assert result is inject
         assert obj.keep is not inject._keys
         assert obj.keep == inject._keys
+        assert obj.template is inject._template
+        assert obj.masked is not inject._masked
+        assert obj.masked == inject._masked
 
     def test_exit(self, mocker):
-        inject = mocker.MagicMock(_keys=set(['a', 'b', 'c', 'd', 'e', 'f']))
+        inject = mocker.MagicMock(
+            _keys=set(['a', 'b', 'c', 'd', 'e', 'f']),
+            _template={'g': 'func'},
+        )
         obj = injector.InjectorCleanup(inject)
         obj.keep = set(['a', 'b', 'c'])
+        obj.template = {}
+        obj.masked = set()
 
         result = obj.__exit__(None, None, None)
 
         assert result is None
         assert obj.keep is None
+        assert obj.template is None
+        assert obj.masked is None
+        assert inject._template == {}
+        assert inject._masked == set()
         inject.__delitem__.assert_has_calls([
             mocker.call('d'),
             mocker.call('e'),
@@ -606,6 +553,8 @@ class TestInjector(object):
         assert result._available == {}
         assert result._deferred == {}
         assert result._keys == set()
+        assert result._template == {}
+        assert result._masked == set()
 
     def test_len(self):
         obj = injector.Injector()
@@ -613,12 +562,43 @@ class TestInjector(object):
 
         assert len(obj) == 3
 
+    def test_len_template(self):
+        obj = injector.Injector()
+        obj._keys |= set(['a', 'b', 'c'])
+        obj._template = {'c': 'func', 'd': 'func', 'e': 'func'}
+        obj._masked = set(['e'])
+
+        assert len(obj) == 4
+
     def test_iter(self):
         obj = injector.Injector()
         obj._keys |= set(['a', 'b', 'c'])
 
         assert set(iter(obj)) == obj._keys
 
+    def test_iter_template(self):
+        obj = injector.Injector()
+        obj._keys |= set(['a', 'b', 'c'])
+        obj._template = {'c': 'func', 'd': 'func', 'e': 'func'}
+        obj._masked = set(['e'])
+
+        result = list(iter(obj))
+
+        assert set(result[:3]) == set(['a', 'b', 'c'])
+        assert result[3:] == ['d']
+
+    def test_contains(self):
+        obj = injector.Injector()
+        obj._keys |= set(['a', 'b'])
+        obj._template = {'b': 'func', 'c': 'func', 'e': 'func'}
+        obj._masked = set(['b', 'e'])
+
+        assert 'a' in obj
+        assert 'b' in obj
+        assert 'c' in obj
+        assert 'd' not in obj
+        assert 'e' not in obj
+
     def test_getitem_available(self, mocker):
         mock_call = mocker.patch.object(
             injector.Injector, '__call__',
@@ -645,6 +625,47 @@ class TestInjector(object):
         assert obj._available == {'a': 'deferred'}
         mock_call.assert_called_once_with('func')
 
+    def test_getitem_template(self, mocker):
+        mock_call = mocker.patch.object(
+            injector.Injector, '__call__',
+            return_value='deferred',
+        )
+        obj = injector.Injector()
+        obj._template = {'a': 'func'}
+
+        assert obj['a'] == 'deferred'
+        assert obj._available == {'a': 'deferred'}
+        assert obj._keys == set(['a'])
+        assert obj._template == {'a': 'func'}
+        mock_call.assert_called_once_with('func')
+
+    def test_getitem_template_masked(self, mocker):
+        mock_call = mocker.patch.object(
+            injector.Injector, '__call__',
+            return_value='deferred',
+        )
+        obj = injector.Injector()
+        obj._available['a'] = 1
+        obj._keys = set(['a'])
+        obj._template = {'a': 'func'}
+
+        assert obj['a'] == 1
+        mock_call.assert_not_called()
+
+    def test_getitem_template_deleted(self, mocker):
+        mock_call = mocker.patch.object(
+            injector.Injector, '__call__',
+            return_value='deferred',
+        )
+        obj = injector.Injector()
+        obj._template = {'a': 'func'}
+        obj._masked = set(['a'])
+
+        with pytest.raises(KeyError):
+            obj['a']
+        assert obj._available == {}
+        mock_call.assert_not_called()
+
     def test_getitem_missing(self, mocker):
         mock_call = mocker.patch.object(
             injector.Injector, '__call__',
@@ -699,6 +720,60 @@ class TestInjector(object):
         assert obj._deferred == {}
         assert obj._keys == set()
 
+    def test_delitem_template_only(self):
+        obj = injector.Injector()
+        obj._template = {'a': 'func'}
+
+        del obj['a']
+
+        assert obj._keys == set()
+        assert obj._masked == set(['a'])
+        assert 'a' not in obj
+
+    def test_delitem_available_and_template(self):
+        obj = injector.Injector()
+        obj._available['a'] = 1
+        obj._keys = set(['a'])
+        obj._template = {'a': 'func'}
+
+        del obj['a']
+
+        assert obj._available == {}
+        assert obj._keys == set()
+        assert obj._masked == set(['a'])
+        assert 'a' not in obj
+
+    def test_delitem_template_deleted(self):
+        obj = injector.Injector()
+        obj._template = {'a': 'func'}
+        obj._masked = set(['a'])
+
+        with pytest.raises(KeyError):
+            del obj['a']
+        assert obj._masked == set(['a'])
+
+    def test_explicit_keys(self):
+        obj = injector.Injector()
+        obj['a'] = 1
+        obj.set_deferred('b', 'deferred')
+        obj.set_deferred_template({'a': 'func', 'c': 'func'})
+
+        assert obj.explicit_keys == set(['a', 'b'])
+
+    def test_mapping_template(self):
+        obj = injector.Injector()
+        obj['a'] = 1
+        obj.set_deferred_template({'b': lambda: 2, 'c': lambda: 3})
+
+        assert obj.pop('b') == 2
+        assert 'b' not in obj
+        assert len(obj) == 2
+
+        obj.clear()
+
+        assert len(obj) == 0
+        assert list(obj) == []
+
     def test_delitem_missing(self):
         obj = injector.Injector()
 
@@ -709,76 +784,42 @@ class TestInjector(object):
         assert obj._keys == set()
 
     def test_call_base(self, mocker):
-        mock_ismethod = mocker.patch.object(
-            injector.inspect, 'ismethod',
-            return_value=False,
-        )
-        mock_get_method_self = mocker.patch.object(
-            injector.six, 'get_method_self',
-            return_value='obj',
-        )
-        mock_get_method_function = mocker.patch.object(
-            injector.six, 'get_method_function',
-            return_value='method',
-        )
         mock_from_func = mocker.patch.object(
             injector.WantSignature, 'from_func',
         )
         obj = injector.Injector()
 
-        result = obj('func', 1, 2, 3, a=4, b=5, c=6)
+        def func():
+            pass
+
+        result = obj(func, 1, 2, 3, a=4, b=5, c=6)
 
         assert result == mock_from_func.return_value.return_value
-        mock_ismethod.assert_called_once_with('func')
-        mock_get_method_self.assert_not_called()
-        mock_get_method_function.assert_not_called()
-        mock_from_func.assert_called_once_with('func')
+        mock_from_func.assert_called_once_with(func)
         mock_from_func.return_value.assert_called_once_with(
             (1, 2, 3), obj, {'a': 4, 'b': 5, 'c': 6},
         )
 
     def test_call_method(self, mocker):
-        mock_ismethod = mocker.patch.object(
-            injector.inspect, 'ismethod',
-            return_value=True,
-        )
-        mock_get_method_self = mocker.patch.object(
-            injector.six, 'get_method_self',
-            return_value='obj',
-        )
-        mock_get_method_function = mocker.patch.object(
-            injector.six, 'get_method_function',
-            return_value='method',
-        )
         mock_from_func = mocker.patch.object(
             injector.WantSignature, 'from_func',
         )
         obj = injector.Injector()
 
-        result = obj('func', 1, 2, 3, a=4, b=5, c=6)
+        class TestClass(object):
+            def method(self):
+                pass
+        target = TestClass()
+
+        result = obj(target.method, 1, 2, 3, a=4, b=5, c=6)
 
         assert result == mock_from_func.return_value.return_value
-        mock_ismethod.assert_called_once_with('func')
-        mock_get_method_self.assert_called_once_with('func')
-        mock_get_method_function.assert_called_once_with('func')
-        mock_from_func.assert_called_once_with('method')
+        mock_from_func.assert_called_once_with(TestClass.method)
         mock_from_func.return_value.assert_called_once_with(
-            ('obj', 1, 2, 3), obj, {'a': 4, 'b': 5, 'c': 6},
+            (target, 1, 2, 3), obj, {'a': 4, 'b': 5, 'c': 6},
         )
 
     def test_call_no_func(self, mocker):
-        mock_ismethod = mocker.patch.object(
-            injector.inspect, 'ismethod',
-            return_value=False,
-        )
-        mock_get_method_self = mocker.patch.object(
-            injector.six, 'get_method_self',
-            return_value='obj',
-        )
-        mock_get_method_function = mocker.patch.object(
-            injector.six, 'get_method_function',
-            return_value='method',
-        )
         mock_from_func = mocker.patch.object(
             injector.WantSignature, 'from_func',
         )
@@ -786,9 +827,6 @@ class TestInjector(object):
 
         with pytest.raises(TypeError):
             obj(a=4, b=5, c=6)
-        mock_ismethod.assert_not_called()
-        mock_get_method_self.assert_not_called()
-        mock_get_method_function.assert_not_called()
         mock_from_func.assert_not_called()
         mock_from_func.return_value.assert_not_called()
 
@@ -798,6 +836,56 @@ class TestInjector(object):
         obj.set_deferred('a', 'deferred')
 
         assert obj._deferred == {'a': 'deferred'}
+        assert obj._keys == set(['a'])
+        assert 'a' in obj
+
+    def test_set_deferred_template(self):
+        template = {'a': 'deferred'}
+        obj = injector.Injector()
+
+        obj.set_deferred_template(template)
+
+        assert obj._template is template
+        assert obj._deferred == {}
+        assert obj._keys == set()
+
+    def test_set_deferred_template_same(self):
+        template = {'a': 'deferred'}
+        obj = injector.Injector()
+        obj._template = template
+
+        obj.set_deferred_template(template)
+
+        assert obj._template is template
+        assert obj._deferred == {}
+        assert obj._keys == set()
+
+    def test_set_deferred_template_existing(self):
+        existing = {'a': 'other', 'b': 'other'}
+        obj = injector.Injector()
+        obj._template = existing
+
+        obj.set_deferred_template({'a': 'deferred', 'c': 'deferred'})
+
+        assert obj._template == {
+            'a': 'deferred',
+            'b': 'other',
+            'c': 'deferred',
+        }
+        assert existing == {'a': 'other', 'b': 'other'}
+        assert obj._deferred == {}
+        assert obj._keys == set()
+
+    def test_set_deferred_template_masked(self):
+        obj = injector.Injector()
+        obj._template = {'a': 'other', 'b': 'other'}
+        obj._masked = set(['a', 'b'])
+
+        obj.set_deferred_template({'a': 'deferred'})
+
+        assert obj._masked == set(['b'])
+        assert 'a' in obj
+        assert 'b' not in obj
 
     def test_cleanup(self, mocker):
         mock_InjectorCleanup = mocker.patch.object(
@@ -860,7 +948,7 @@ class TestWraps(object):
         mock_from_func = mocker.patch.object(
             injector.WantSignature, 'from_func',
         )
-        mock_wraps = mocker.patch.object(injector.six, 'wraps')
+        mock_wraps = mocker.patch.object(injector.functools, 'wraps')
         func = mocker.Mock()
 
         decorator = injector.wraps('wrapped')
@@ -886,7 +974,7 @@ class TestWraps(object):
         mock_from_func = mocker.patch.object(
             injector.WantSignature, 'from_func',
         )
-        mock_wraps = mocker.patch.object(injector.six, 'wraps')
+        mock_wraps = mocker.patch.object(injector.functools, 'wraps')
         func = mocker.Mock()
 
         decorator = injector.wraps(
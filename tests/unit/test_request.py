@@ -55,10 +55,9 @@ class TestRequest(object):
             root.parent = None
             elems[cont.root].parent = root
             parent = cont
-        meth = mocker.Mock(_micropath_elem=elems['d'])
-        mock_get_method_self = mocker.patch.object(
-            request.six, 'get_method_self',
-            return_value=controllers[-1],
+        meth = mocker.Mock(
+            _micropath_elem=elems['d'],
+            __self__=controllers[-1],
         )
         mock_isclass = mocker.patch.object(
             request.inspect, 'isclass',
@@ -72,7 +71,6 @@ class TestRequest(object):
         result = obj.url_for(meth, b=1, d=2)
 
         assert result == 'http://example.com/this/a/1/c/2'
-        mock_get_method_self.assert_called_once_with(meth)
         mock_isclass.assert_called_once_with(controllers[-1])
 
     def test_url_for_too_few_arguments(self, mocker):
@@ -103,10 +101,6 @@ class TestRequest(object):
             root.parent = None
             elems[cont.root].parent = root
             parent = cont
-        mock_get_method_self = mocker.patch.object(
-            request.six, 'get_method_self',
-            return_value=controllers[-1],
-        )
         mock_isclass = mocker.patch.object(
             request.inspect, 'isclass',
             return_value=False,
@@ -118,7 +112,6 @@ class TestRequest(object):
 
         with pytest.raises(TypeError):
             obj.url_for(b=1, d=2)
-        mock_get_method_self.assert_not_called()
         mock_isclass.assert_not_called()
 
     def test_url_for_too_many_arguments(self, mocker):
@@ -149,10 +142,9 @@ class TestRequest(object):
             root.parent = None
             elems[cont.root].parent = root
             parent = cont
-        meth = mocker.Mock(_micropath_elem=elems['d'])
-        mock_get_method_self = mocker.patch.object(
-            request.six, 'get_method_self',
-            return_value=controllers[-1],
+        meth = mocker.Mock(
+            _micropath_elem=elems['d'],
+            __self__=controllers[-1],
         )
         mock_isclass = mocker.patch.object(
             request.inspect, 'isclass',
@@ -165,7 +157,6 @@ class TestRequest(object):
 
         with pytest.raises(TypeError):
             obj.url_for(meth, 'too', 'many', b=1, d=2)
-        mock_get_method_self.assert_not_called()
         mock_isclass.assert_not_called()
 
     def test_url_for_non_callable(self, mocker):
@@ -196,10 +187,9 @@ class TestRequest(object):
             root.parent = None
             elems[cont.root].parent = root
             parent = cont
-        meth = mocker.NonCallableMock(_micropath_elem=elems['d'])
-        mock_get_method_self = mocker.patch.object(
-            request.six, 'get_method_self',
-            return_value=controllers[-1],
+        meth = mocker.NonCallableMock(
+            _micropath_elem=elems['d'],
+            __self__=controllers[-1],
         )
         mock_isclass = mocker.patch.object(
             request.inspect, 'isclass',
@@ -212,7 +202,6 @@ class TestRequest(object):
 
         with pytest.raises(ValueError):
             obj.url_for(meth, b=1, d=2)
-        mock_get_method_self.assert_not_called()
         mock_isclass.assert_not_called()
 
     def test_url_for_no_element(self, mocker):
@@ -243,10 +232,9 @@ class TestRequest(object):
             root.parent = None
             elems[cont.root].parent = root
             parent = cont
-        meth = mocker.Mock(_micropath_elem=None)
-        mock_get_method_self = mocker.patch.object(
-            request.six, 'get_method_self',
-            return_value=controllers[-1],
+        meth = mocker.Mock(
+            _micropath_elem=None,
+            __self__=controllers[-1],
         )
         mock_isclass = mocker.patch.object(
             request.inspect, 'isclass',
@@ -259,7 +247,6 @@ class TestRequest(object):
 
         with pytest.raises(ValueError):
             obj.url_for(meth, b=1, d=2)
-        mock_get_method_self.assert_not_called()
         mock_isclass.assert_not_called()
 
     def test_url_for_class_method(self, mocker):
@@ -290,10 +277,9 @@ class TestRequest(object):
             root.parent = None
             elems[cont.root].parent = root
             parent = cont
-        meth = mocker.Mock(_micropath_elem=elems['d'])
-        mock_get_method_self = mocker.patch.object(
-            request.six, 'get_method_self',
-            return_value=controllers[-1],
+        meth = mocker.Mock(
+            _micropath_elem=elems['d'],
+            __self__=controllers[-1],
         )
         mock_isclass = mocker.patch.object(
             request.inspect, 'isclass',
@@ -306,7 +292,6 @@ class TestRequest(object):
 
         with pytest.raises(ValueError):
             obj.url_for(meth, b=1, d=2)
-        mock_get_method_self.assert_called_once_with(meth)
         mock_isclass.assert_called_once_with(controllers[-1])
 
     def test_url_for_missing_binding(self, mocker):
@@ -337,10 +322,9 @@ class TestRequest(object):
             root.parent = None
             elems[cont.root].parent = root
             parent = cont
-        meth = mocker.Mock(_micropath_elem=elems['d'])
-        mock_get_method_self = mocker.patch.object(
-            request.six, 'get_method_self',
-            return_value=controllers[-1],
+        meth = mocker.Mock(
+            _micropath_elem=elems['d'],
+            __self__=controllers[-1],
         )
         mock_isclass = mocker.patch.object(
             request.inspect, 'isclass',
@@ -353,7 +337,6 @@ class TestRequest(object):
 
         with pytest.raises(ValueError):
             obj.url_for(meth, b=1)
-        mock_get_method_self.assert_called_once_with(meth)
         mock_isclass.assert_called_once_with(controllers[-1])
 
     def test_injector_cached(self, mocker):
@@ -373,6 +356,31 @@ class TestRequest(object):
         assert obj.environ['micropath.injector'] == mock_Injector.return_value
         mock_Injector.assert_called_once_with()
 
+    def test_response_cached(self, mocker):
+        obj = request.Request.blank('/')
+        mock_ResponseClass = mocker.patch.object(obj, 'ResponseClass')
+        obj.environ['micropath.response'] = 'cached'
+
+        assert obj.response == 'cached'
+        mock_ResponseClass.assert_not_called()
+
+    def test_response_uncached(self, mocker):
+        obj = request.Request.blank('/')
+        mock_ResponseClass = mocker.patch.object(obj, 'ResponseClass')
+
+        assert obj.response == mock_ResponseClass.return_value
+        assert obj.environ['micropath.response'] == (
+            mock_ResponseClass.return_value
+        )
+        mock_ResponseClass.assert_called_once_with()
+
+    def test_response_set(self):
+        obj = request.Request.blank('/')
+
+        obj.response = 'response'
+
+        assert obj.environ['micropath.response'] == 'response'
+
     def test_base_path_get(self):
         obj = request.Request.blank('/')
         obj.environ['micropath.base_path'] = '/base/path'